@@ -2651,7 +2651,9 @@ class EnvironmentCommands:
             print(f"\n📋 Setting model importance for workflow: {workflow_name}")
             print(f"   Found {len(models)} model(s)\n")
 
-            updated_count = 0
+            # identifier → new importance, applied in one write after prompting
+            updates: dict[str, str] = {}
+            cancelled = False
             for model in models:
                 current_importance = model.criticality
                 display_name = model.filename
@@ -2667,7 +2669,8 @@ class EnvironmentCommands:
                     choice = input("  Choice: ").strip().lower()
                 except (KeyboardInterrupt, EOFError):
                     print("\n✗ Cancelled")
-                    return
+                    cancelled = True
+                    break
 
                 # Map choice to importance level
                 importance_map = {
@@ -2686,21 +2689,20 @@ class EnvironmentCommands:
                         print(f"  → Invalid choice, skipping")
                         continue
 
-                # Update model importance
                 identifier = model.hash if model.hash else model.filename
-                success = env.workflow_manager.update_model_criticality(
-                    workflow_name=workflow_name,
-                    model_identifier=identifier,
-                    new_criticality=new_importance
-                )
+                updates[identifier] = new_importance
+                print(f"  → Set to: {new_importance}")
 
-                if success:
-                    print(f"  ✓ Updated to: {new_importance}")
-                    updated_count += 1
-                else:
-                    print(f"  ✗ Failed to update")
+            # Choices made before a cancel are still kept, as they were saved per model before
+            if not updates:
+                return
+            found = env.workflow_manager.update_model_criticalities(workflow_name, updates)
+            for identifier, success in found.items():
+                if not success:
+                    print(f"  ✗ Failed to update '{identifier}'")
 
-            print(f"\n✓ Updated {updated_count}/{len(models)} model(s)")
+            if not cancelled:
+                print(f"\n✓ Updated {sum(found.values())}/{len(models)} model(s)")
 
     def _select_workflow_interactive(self, env) -> str | None:
         """Interactive workflow selection from available workflows.
@@ -3,7 +3,10 @@
 from pathlib import Path
 from typing import Any
 
-import tomlkit
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    import tomli as tomllib
 
 from ..logging.logging_config import get_logger
 from ..models.environment import GitStatus
@@ -55,7 +58,7 @@ class GitChangeParser:
             if not committed_content:
                 return changes
 
-            committed_config = tomlkit.loads(committed_content)
+            committed_config = tomllib.loads(committed_content)
 
             # Compare each category
             self._compare_nodes(committed_config, current_config, changes)
@@ -7,7 +7,10 @@ before applying git operations.
 import hashlib
 from pathlib import Path
 
-import tomlkit
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    import tomli as tomllib
 
 from ..logging.logging_config import get_logger
 from ..models.ref_diff import (
@@ -82,7 +85,7 @@ class RefDiffAnalyzer:
     def _get_config_at_ref(self, ref: str) -> dict:
         """Load pyproject.toml from a git ref."""
         content = git_show(self.repo_path, ref, Path("pyproject.toml"), is_text=True)
-        return tomlkit.loads(content) if content else {}
+        return tomllib.loads(content) if content else {}
 
     def _get_merge_base(self, ref1: str, ref2: str) -> str | None:
         """Find common ancestor of two refs."""
@@ -175,10 +175,13 @@ class StatusScanner:
             pyproject_path = node_dir / "pyproject.toml"
             if pyproject_path.exists():
                 try:
-                    import tomlkit
+                    try:
+                        import tomllib
+                    except ModuleNotFoundError:  # Python 3.10
+                        import tomli as tomllib
 
-                    with open(pyproject_path, encoding='utf-8') as f:
-                        data = tomlkit.load(f)
+                    with open(pyproject_path, 'rb') as f:
+                        data = tomllib.load(f)
 
                     # Try different locations for version
                     project_section = data.get("project")
@@ -1,6 +1,7 @@
 """Workflow dependency analysis and resolution manager."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, List
 
@@ -11,6 +12,7 @@ from .node_classifier import NodeClassifier
 from ..configs.model_config import ModelConfig
 from ..configs.comfyui_models import MULTI_MODEL_WIDGET_CONFIGS
 from ..models.workflow import (
+    Workflow,
     WorkflowNodeWidgetRef,
     WorkflowNode,
     WorkflowDependencies,
@@ -18,6 +20,31 @@ from ..models.workflow import (
 
 logger = get_logger(__name__)
 
+
+def _file_version(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for cache keys, or None if the file can't be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _load_workflow(workflow_path: Path, version: tuple[int, int] | None) -> Workflow:
+    """Parse a workflow file, memoized on (path, (mtime_ns, size)) so edits invalidate it.
+
+    Parsed workflows are shared between parsers and must be treated as read-only.
+    """
+    return WorkflowRepository.load(workflow_path)
+
+
+@lru_cache(maxsize=32)
+def _get_node_classifier(cec_path: Path | None, version: tuple[int, int] | None) -> NodeClassifier:
+    """Build a NodeClassifier once per environment, rebuilt when comfyui_builtins.json changes."""
+    return NodeClassifier(cec_path)
+
+
 class WorkflowDependencyParser:
     """Manages workflow dependency analysis and resolution."""
 
@@ -30,9 +57,12 @@ class WorkflowDependencyParser:
 
         self.model_config = model_config or ModelConfig.load()
         self.cec_path = cec_path
+        # str.endswith accepts a tuple, checking every extension in one C call
+        self._model_extensions = tuple(self.model_config.default_extensions)
 
-        # Load workflow
-        self.workflow = WorkflowRepository.load(workflow_path)
+        # Load workflow (reused across parsers until the file changes).
+        # A missing file keys as None and the loader raises its usual error.
+        self.workflow = _load_workflow(workflow_path, _file_version(workflow_path))
         logger.debug(f"Loaded workflow '{workflow_path.stem}' with {len(self.workflow.nodes)} nodes")
 
         # Store workflow name for pyproject lookup
@@ -51,21 +81,26 @@ class WorkflowDependencyParser:
             builtin_nodes: list[WorkflowNode] = []
             missing_nodes: list[WorkflowNode] = []
 
-            # Create classifier with environment-specific builtins
-            classifier = NodeClassifier(self.cec_path)
+            # Classifier with environment-specific builtins (shared across parsers)
+            builtins_version = _file_version(self.cec_path / "comfyui_builtins.json") if self.cec_path else None
+            classifier = _get_node_classifier(self.cec_path, builtins_version)
+
+            # Bind hot-loop methods once instead of per node
+            classify = classifier.classify_single_node
+            extract_refs = self._extract_model_node_refs
+            add_models = found_models.extend
+            add_builtin = builtin_nodes.append
+            add_missing = missing_nodes.append
 
             # Analyze and resolve models and nodes
             # Iterate over items() to preserve scoped IDs for subgraph nodes
             for node_id, node_info in nodes_data.items():
-                node_classification = classifier.classify_single_node(node_info)
-                model_refs = self._extract_model_node_refs(node_id, node_info)
-                
-                found_models.extend(model_refs)
-                
-                if node_classification == 'builtin':
-                    builtin_nodes.append(node_info)
+                add_models(extract_refs(node_id, node_info))
+
+                if classify(node_info) == 'builtin':
+                    add_builtin(node_info)
                 else:
-                    missing_nodes.append(node_info)
+                    add_missing(node_info)
                     
             # Log results
             if found_models:
@@ -98,6 +133,7 @@ class WorkflowDependencyParser:
             node_info: WorkflowNode object containing node data
         """
         refs: list[WorkflowNodeWidgetRef] = []
+        node_type = node_info.type
 
         # Strategy 1: Extract from properties.models (preferred - has URLs)
         property_models = node_info.properties.get('models', [])
@@ -105,12 +141,12 @@ class WorkflowDependencyParser:
             refs.extend(self._extract_from_properties_models(node_id, node_info, property_models))
 
         # Strategy 2: Multi-model nodes (explicit widget indices from config)
-        if node_info.type in MULTI_MODEL_WIDGET_CONFIGS:
+        if node_type in MULTI_MODEL_WIDGET_CONFIGS:
             widget_refs = self._extract_multi_model_widgets(node_id, node_info)
             refs = self._merge_model_refs(refs, widget_refs)
 
         # Strategy 3: Standard single-model loaders
-        elif self.model_config.is_model_loader_node(node_info.type):
+        elif self.model_config.is_model_loader_node(node_type):
             widget_refs = self._extract_single_model_widget(node_id, node_info)
             refs = self._merge_model_refs(refs, widget_refs)
 
@@ -155,11 +191,15 @@ class WorkflowDependencyParser:
 
     def _find_widget_index_for_name(self, node_info: WorkflowNode, name: str) -> int | None:
         """Find widget index that contains the given model name."""
-        widgets = node_info.widgets_values or []
-        for idx, value in enumerate(widgets):
-            if isinstance(value, str) and value == name:
-                return idx
-        return None
+        # Some custom nodes (e.g. VideoHelperSuite) store widgets_values as a dict
+        widgets = node_info.widgets_values
+        if not isinstance(widgets, list):
+            return None
+        # name is always a str, so list.index's == never matches non-string widgets
+        try:
+            return widgets.index(name)
+        except ValueError:
+            return None
 
     def _extract_multi_model_widgets(self, node_id: str, node_info: WorkflowNode) -> list[WorkflowNodeWidgetRef]:
         """Extract models from multi-model nodes using MULTI_MODEL_WIDGET_CONFIGS.
@@ -203,9 +243,10 @@ class WorkflowDependencyParser:
         """Extract models by pattern matching widget values (for custom nodes)."""
         refs = []
         widgets = node_info.widgets_values or []
+        looks_like_model = self._looks_like_model
 
         for idx, value in enumerate(widgets):
-            if self._looks_like_model(value):
+            if looks_like_model(value):
                 refs.append(WorkflowNodeWidgetRef(
                     node_id=node_id,
                     node_type=node_info.type,
@@ -224,6 +265,10 @@ class WorkflowDependencyParser:
         Property refs take precedence when both have the same widget_value,
         since they may contain URL metadata for auto-download.
         """
+        # Most nodes carry no properties.models, so there is nothing to merge
+        if not property_refs:
+            return widget_refs
+
         # Build set of values already in property_refs
         property_values = {ref.widget_value for ref in property_refs}
 
@@ -237,7 +282,4 @@ class WorkflowDependencyParser:
     
     def _looks_like_model(self, value: Any) -> bool:
         """Check if value looks like a model path"""
-        if not isinstance(value, str):
-            return False
-        extensions = self.model_config.default_extensions
-        return any(value.endswith(ext) for ext in extensions)
+        return isinstance(value, str) and value.endswith(self._model_extensions)
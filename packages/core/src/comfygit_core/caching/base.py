@@ -152,13 +152,15 @@ class ContentCacheBase(CacheBase):
         return hasher.hexdigest()
 
     def cache_content(self, cache_key: str, source_path: Path,
-                     metadata: dict | None = None) -> Path:
+                     metadata: dict | None = None, move: bool = False) -> Path:
         """Cache content from source directory.
 
         Args:
             cache_key: Unique cache key
             source_path: Path to source content directory
             metadata: Optional additional metadata to store
+            move: Move source_path into the store instead of copying it (a plain
+                rename when source_path is on the cache filesystem)
 
         Returns:
             Path to cached content directory
@@ -172,8 +174,10 @@ class ContentCacheBase(CacheBase):
 
         cache_dir.mkdir(parents=True)
 
-        # Copy content
-        shutil.copytree(source_path, content_dir)
+        if move:
+            shutil.move(str(source_path), str(content_dir))
+        else:
+            shutil.copytree(source_path, content_dir)
 
         # Calculate metadata
         size_bytes = sum(
@@ -3,6 +3,10 @@
 import hashlib
 import json
 import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -54,6 +58,8 @@ class CustomNodeCacheManager(ContentCacheBase):
         """
         super().__init__("custom_nodes", cache_base_path)
         self.lock_file = self.cache_dir / ".lock"
+        # Serializes store/index writes when nodes are downloaded concurrently
+        self._write_lock = threading.Lock()
 
         # Load node-specific index
         self.node_index = self._load_node_index()
@@ -146,18 +152,33 @@ class CustomNodeCacheManager(ContentCacheBase):
         logger.debug(f"Generated cached path for '{node_info.name}': {content_path}")
 
         # Update access time and count
-        if cache_key in self.node_index:
-            self.node_index[cache_key].last_accessed = datetime.now(timezone.utc).isoformat()
-            self.node_index[cache_key].access_count += 1
-            self._save_node_index()
+        with self._write_lock:
+            if cache_key in self.node_index:
+                self.node_index[cache_key].last_accessed = datetime.now(timezone.utc).isoformat()
+                self.node_index[cache_key].access_count += 1
+                self._save_node_index()
 
         return content_path
 
+    @contextmanager
+    def acquire_staging_path(self, node_info: NodeInfo) -> Iterator[Path]:
+        """Yield a scratch path inside the cache for downloading a node.
+
+        Staging on the same filesystem as the store lets cache_node(move=True)
+        rename the download into place rather than copying it. Whatever is left
+        at the path is removed on exit.
+        """
+        staging_dir = self.cache_dir / "staging"
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=staging_dir) as tmpdir:
+            yield Path(tmpdir) / node_info.name
+
     def cache_node(
         self,
         node_info: NodeInfo,
         source_path: Path,
         archive_path: Path | None = None,
+        move: bool = False,
     ) -> Path:
         """Cache a custom node from a source directory.
 
@@ -165,6 +186,7 @@ class CustomNodeCacheManager(ContentCacheBase):
             node_info: The node specification
             source_path: Path to the extracted node content
             archive_path: Optional path to the original archive
+            move: Move source_path into the cache instead of copying it
 
         Returns:
             Path to the cached content
@@ -178,37 +200,39 @@ class CustomNodeCacheManager(ContentCacheBase):
             "has_archive": archive_path is not None,
         }
 
-        # Use base class cache_content method
-        content_dir = self.cache_content(cache_key, source_path, metadata)
+        with self._write_lock:
+            # Use base class cache_content method
+            content_dir = self.cache_content(cache_key, source_path, metadata, move=move)
+
+            # Copy archive if provided
+            if archive_path and archive_path.exists():
+                cache_dir = self.store_dir / cache_key
+                archive_dest = cache_dir / "archive"
+                shutil.copy2(archive_path, archive_dest)
 
-        # Copy archive if provided
-        if archive_path and archive_path.exists():
+            # Get size and hash from base class
             cache_dir = self.store_dir / cache_key
-            archive_dest = cache_dir / "archive"
-            shutil.copy2(archive_path, archive_dest)
+            metadata_file = cache_dir / "metadata.json"
+            with open(metadata_file, encoding='utf-8') as f:
+                full_metadata = json.load(f)
+
+            # Update node-specific index
+            self.node_index[cache_key] = CachedNodeInfo(
+                cache_key=cache_key,
+                name=node_info.name,
+                install_method=node_info.source,
+                url=node_info.download_url or node_info.repository or "",
+                ref=node_info.version,
+                cached_at=full_metadata["cached_at"],
+                last_accessed=full_metadata["cached_at"],
+                access_count=1,
+                size_bytes=full_metadata["size_bytes"],
+                content_hash=full_metadata["content_hash"],
+                source_info=full_metadata,
+            )
 
-        # Get size and hash from base class
-        cache_dir = self.store_dir / cache_key
-        metadata_file = cache_dir / "metadata.json"
-        with open(metadata_file, encoding='utf-8') as f:
-            full_metadata = json.load(f)
-
-        # Update node-specific index
-        self.node_index[cache_key] = CachedNodeInfo(
-            cache_key=cache_key,
-            name=node_info.name,
-            install_method=node_info.source,
-            url=node_info.download_url or node_info.repository or "",
-            ref=node_info.version,
-            cached_at=full_metadata["cached_at"],
-            last_accessed=full_metadata["cached_at"],
-            access_count=1,
-            size_bytes=full_metadata["size_bytes"],
-            content_hash=full_metadata["content_hash"],
-            source_info=full_metadata,
-        )
+            self._save_node_index()
 
-        self._save_node_index()
         logger.info(
             f"Cached {node_info.name} ({format_size(full_metadata['size_bytes'])}) with key: {cache_key}"
         )
@@ -501,6 +501,28 @@ class WorkflowCacheRepository:
 
             logger.debug(f"Invalidated cache for environment '{env_name}'")
 
+    def invalidate_resolution(self, env_name: str, workflow_name: str) -> None:
+        """Drop a workflow's cached resolution but keep its dependency analysis.
+
+        For pyproject-only changes (model hashes, criticality) the workflow file is
+        unchanged, so its parsed dependencies stay valid. The persisted row is
+        re-checked against the resolution context hash on the next lookup, but
+        session entries are keyed by workflow mtime alone and must be downgraded here.
+
+        Args:
+            env_name: Environment name
+            workflow_name: Workflow name
+        """
+        prefix = f"{env_name}:{workflow_name}:"
+        for key, cached in list(self._session_cache.items()):
+            if key.startswith(prefix) and not cached.needs_reresolution:
+                self._session_cache[key] = CachedWorkflowAnalysis(
+                    dependencies=cached.dependencies,
+                    resolution=None,
+                    needs_reresolution=True
+                )
+        logger.debug(f"Invalidated cached resolution for workflow '{workflow_name}'")
+
     def _update_pyproject_mtime(self, env_name: str, workflow_name: str, new_mtime: float) -> None:
         """Update pyproject_mtime in cache after successful context check.
 
@@ -773,14 +795,8 @@ class WorkflowCacheRepository:
 
         # 4. Model index subset (only models THIS workflow references)
         step_start = time.perf_counter()
-        model_index_subset = {}
-        for model_ref in dependencies.found_models:
-            filename = Path(model_ref.widget_value).name
-            models = self.model_repository.find_by_filename(filename)
-            if models:
-                model_index_subset[filename] = [m.hash for m in models]
-
-        context["model_index_subset"] = model_index_subset
+        filenames = {Path(model_ref.widget_value).name for model_ref in dependencies.found_models}
+        context["model_index_subset"] = self.model_repository.find_hashes_by_filenames(filenames)
         step_elapsed = (time.perf_counter() - step_start) * 1000
         logger.debug(f"[CONTEXT] Step 4 (model index queries, {len(dependencies.found_models)} models) took {step_elapsed:.2f}ms")
 
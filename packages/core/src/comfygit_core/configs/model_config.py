@@ -2,6 +2,7 @@
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -25,26 +26,33 @@ class ModelConfig:
     def load(cls, config_path: Path | None = None) -> "ModelConfig":
         """Load model configuration from file.
 
+        Parsed configs are shared per process; a file is re-read only when its
+        mtime or size changes.
+
         Args:
             config_path: Path to config file, or None to use default
 
         Returns:
             ModelConfig instance
         """
-        data = {}
         if config_path is None:
             # Load hardcoded config (fallback)
-            data = COMFYUI_MODELS_CONFIG
-        else:
-            if not config_path.exists():
-                raise FileNotFoundError(f"Model config file not found: {config_path}")
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            except Exception as e:
-                logger.error(f"Failed to load model config from {config_path}: {e}")
-                raise
+            return _load_default_config()
+
+        if not config_path.exists():
+            raise FileNotFoundError(f"Model config file not found: {config_path}")
+        stat = config_path.stat()
+        return _load_config_file(config_path, (stat.st_mtime_ns, stat.st_size))
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached configs so the next load() re-reads them."""
+        _load_default_config.cache_clear()
+        _load_config_file.cache_clear()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ModelConfig":
+        """Build a ModelConfig from raw config data."""
         return cls(
             version=data.get("version", "unknown"),
             default_extensions=data.get("default_extensions", []),
@@ -148,4 +156,21 @@ class ModelConfig:
         if not directories:
             return []
 
-        return [f"{directory}/{widget_value}" for directory in directories]
\ No newline at end of file
+        return [f"{directory}/{widget_value}" for directory in directories]
+
+
+@lru_cache(maxsize=1)
+def _load_default_config() -> ModelConfig:
+    return ModelConfig.from_dict(COMFYUI_MODELS_CONFIG)
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(config_path: Path, version: tuple[int, int]) -> ModelConfig:
+    """Parse a config file; version is (mtime_ns, size) so edits miss the cache."""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.error(f"Failed to load model config from {config_path}: {e}")
+        raise
+    return ModelConfig.from_dict(data)
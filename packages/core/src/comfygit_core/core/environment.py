@@ -1620,10 +1620,17 @@ class Environment:
         logger.info("Committing all changes...")
         config = self.pyproject.load()
 
+        changed_resolutions = []
         for wf_analysis in workflow_status.analyzed_workflows:
             if wf_analysis.sync_state in ("new", "modified"):
                 # Apply resolution results to pyproject (in-memory mutations)
-                self.workflow_manager.apply_resolution(wf_analysis.resolution, config=config)
+                self.workflow_manager.apply_resolution(
+                    wf_analysis.resolution, config=config, update_paths=False
+                )
+                changed_resolutions.append(wf_analysis.resolution)
+
+        # Workflow JSON path rewrites are independent per file - run them together
+        self.workflow_manager.update_workflow_model_paths_batch(changed_resolutions)
 
         # Clean up orphaned workflows from pyproject.toml
         # This handles BOTH:
@@ -1817,16 +1824,16 @@ class Environment:
         from ..managers.export_import_manager import ExportImportManager
         from ..models.exceptions import CDExportError, ExportErrorContext
 
-        # Validation: Get workflow status first for comprehensive checks
-        status = self.workflow_manager.get_workflow_status()
+        # Validation: Sync status first - cheap, and enough to reject uncommitted workflows
+        sync_status = self.workflow_manager.get_workflow_sync_status()
 
         # Check for uncommitted workflow changes (new, modified, or deleted)
-        if status.sync_status.has_changes:
+        if sync_status.has_changes:
             context = ExportErrorContext(
                 uncommitted_workflows=(
-                    status.sync_status.new +
-                    status.sync_status.modified +
-                    status.sync_status.deleted
+                    sync_status.new +
+                    sync_status.modified +
+                    sync_status.deleted
                 )
             )
             raise CDExportError(
@@ -1842,8 +1849,9 @@ class Environment:
                 context=context
             )
 
-        # Validation: Check all workflows are resolved (unless allow_issues)
-        if not status.is_commit_safe and not allow_issues:
+        # Validation: Check all workflows are resolved (unless allow_issues).
+        # Full resolution is only needed for this check, so skip it when issues are allowed.
+        if not allow_issues and not self.workflow_manager.get_workflow_status(sync_status).is_commit_safe:
             context = ExportErrorContext(has_unresolved_issues=True)
             raise CDExportError(
                 "Cannot export - workflows have unresolved issues",
@@ -645,8 +645,11 @@ class NodeManager:
         if callbacks and callbacks.on_batch_start and nodes_to_install:
             callbacks.on_batch_start(len(nodes_to_install))
 
+        # Fetch all missing nodes concurrently, installing each from cache as it arrives
+        downloads = self.node_lookup.download_many_to_cache(nodes_to_install)
+
         success_count = 0
-        for idx, node_info in enumerate(nodes_to_install):
+        for idx, (node_info, cache_path, error) in enumerate(downloads):
             node_path = self.custom_nodes_path / node_info.name
 
             if callbacks and callbacks.on_node_start:
@@ -654,8 +657,6 @@ class NodeManager:
 
             logger.info(f"Installing missing node: {node_info.name}")
             try:
-                # Download to cache
-                cache_path = self.node_lookup.download_to_cache(node_info)
                 if cache_path:
                     shutil.copytree(cache_path, node_path, dirs_exist_ok=True)
                     logger.info(f"Successfully installed node: {node_info.name}")
@@ -663,9 +664,9 @@ class NodeManager:
                     if callbacks and callbacks.on_node_complete:
                         callbacks.on_node_complete(node_info.name, True, None)
                 else:
-                    logger.warning(f"Could not download node '{node_info.name}'")
+                    logger.warning(f"Could not download node '{node_info.name}': {error}")
                     if callbacks and callbacks.on_node_complete:
-                        callbacks.on_node_complete(node_info.name, False, "Download failed")
+                        callbacks.on_node_complete(node_info.name, False, error)
             except Exception as e:
                 logger.warning(f"Could not download node '{node_info.name}': {e}")
                 if callbacks and callbacks.on_node_complete:
@@ -6,6 +6,7 @@ especially for UV-based Python projects.
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 from functools import cached_property
 from pathlib import Path
@@ -165,6 +166,8 @@ class PyprojectManager:
     def save(self, config: dict | None = None) -> None:
         """Save the configuration to pyproject.toml.
 
+        The file is replaced atomically, so batch callers that pass one in-memory
+        config through many edits pay for a single write and fsync.
         Automatically invalidates the cache to ensure fresh reads after save.
 
         Args:
@@ -182,13 +185,22 @@ class PyprojectManager:
         # Ensure proper spacing between major sections
         self._ensure_section_spacing(config)
 
+        # Serialize before touching disk so a bad document leaves the file intact
+        content = tomlkit.dumps(config)
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+
         try:
             # Ensure parent directory exists
             self.path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.path, 'w', encoding='utf-8') as f:
-                tomlkit.dump(config, f)
+            # Write to a sibling temp file and swap it in, so readers never see a partial file
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
         except OSError as e:
+            temp_path.unlink(missing_ok=True)
             raise CDPyprojectError(f"Failed to write pyproject.toml to {self.path}: {e}")
 
         # Invalidate cache after save to ensure fresh reads
@@ -1053,10 +1065,15 @@ class NodeHandler(BaseHandler):
     #     node = nodes.get(identifier)
     #     return node and hasattr(node, 'version') and node.version == 'dev'
 
-    def get_existing(self) -> dict[str, NodeInfo]:
-        """Get all existing custom nodes from pyproject.toml."""
+    def get_existing(self, config: dict | None = None) -> dict[str, NodeInfo]:
+        """Get all existing custom nodes from pyproject.toml.
+
+        Args:
+            config: Optional in-memory config for batched reads. If None, loads from disk.
+        """
         from ..models.shared import NodeInfo
-        config = self.load()
+        if config is None:
+            config = self.load()
         nodes_data = config.get('tool', {}).get('comfygit', {}).get('nodes', {})
 
         result = {}
@@ -1538,14 +1555,18 @@ class ModelHandler(BaseHandler):
 
         logger.debug(f"Added model: {model.filename} ({model.hash[:8]}...)")
 
-    def get_all(self) -> list[ManifestModel]:
+    def get_all(self, config: dict | None = None) -> list[ManifestModel]:
         """Get all models in manifest.
 
+        Args:
+            config: Optional in-memory config for batched reads. If None, loads from disk.
+
         Returns:
             List of ManifestModel objects
         """
         try:
-            config = self.load()
+            if config is None:
+                config = self.load()
             models_data = config.get("tool", {}).get("comfygit", {}).get("models", {})
 
             return [
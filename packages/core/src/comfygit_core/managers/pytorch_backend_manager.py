@@ -6,10 +6,14 @@ from pathlib import Path
 
 from ..constants import PYTORCH_CORE_PACKAGES
 from ..logging.logging_config import get_logger
+from ..utils import pytorch_prober
 from ..utils.pytorch import get_pytorch_index_url
 
 logger = get_logger(__name__)
 
+# A .gitignore line holding exactly the .pytorch-backend entry (optionally commented after)
+_GITIGNORE_ENTRY_RE = re.compile(r'^[ \t]*\.pytorch-backend[ \t]*(?:#.*)?$', re.MULTILINE)
+
 
 class PyTorchBackendManager:
     """Manages .pytorch-backend file and PyTorch configuration injection.
@@ -19,13 +23,15 @@ class PyTorchBackendManager:
     while sharing the same environment configuration.
     """
 
-    # Valid backend patterns
-    BACKEND_PATTERNS = [
-        r'^cu\d{2,3}$',  # CUDA: cu118, cu121, cu128, cu130, etc.
-        r'^cpu$',  # CPU
-        r'^rocm\d+\.\d+$',  # ROCm: rocm6.2, rocm6.3, etc.
-        r'^xpu$',  # Intel XPU
-    ]
+    # Valid backend patterns, compiled once as a single alternation (used with fullmatch)
+    BACKEND_PATTERN = re.compile(
+        r'(?:'
+        r'cu\d{2,3}'  # CUDA: cu118, cu121, cu128, cu130, etc.
+        r'|cpu'  # CPU
+        r'|rocm\d+\.\d+'  # ROCm: rocm6.2, rocm6.3, etc.
+        r'|xpu'  # Intel XPU
+        r')'
+    )
 
     def __init__(self, cec_path: Path):
         """Initialize manager.
@@ -35,6 +41,38 @@ class PyTorchBackendManager:
         """
         self.cec_path = cec_path
         self.backend_file = cec_path / ".pytorch-backend"
+        # ((mtime_ns, size), backend, versions) from the last read of backend_file
+        self._parsed: tuple[tuple[int, int], str, dict[str, str]] | None = None
+        # (python_version, backend) → probed versions for backend overrides
+        self._override_versions: dict[tuple[str, str], dict[str, str]] = {}
+        # .gitignore entry is confirmed once per manager; later set_backend calls skip the scan
+        self._gitignore_checked = False
+
+    def _read_backend_file(self) -> tuple[str, dict[str, str]] | None:
+        """Parse .pytorch-backend, reusing the last parse while the file is unchanged.
+
+        Returns:
+            (backend, versions) tuple, or None if the file doesn't exist
+        """
+        try:
+            stat = self.backend_file.stat()
+        except FileNotFoundError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._parsed is None or self._parsed[0] != key:
+            lines = self.backend_file.read_text().strip().split('\n')
+            versions = {}
+
+            # Skip first line (backend), parse remaining as pkg=version
+            for line in lines[1:]:
+                if '=' in line:
+                    pkg, version = line.split('=', 1)
+                    versions[pkg.strip()] = version.strip()
+
+            self._parsed = (key, lines[0].strip(), versions)
+
+        return self._parsed[1], self._parsed[2]
 
     def get_backend(self) -> str:
         """Read backend from file (first line only).
@@ -45,12 +83,11 @@ class PyTorchBackendManager:
         Raises:
             ValueError: If .pytorch-backend file doesn't exist or is empty
         """
-        if self.backend_file.exists():
-            lines = self.backend_file.read_text().strip().split('\n')
-            if lines and lines[0]:
-                backend = lines[0].strip()
-                logger.debug(f"Read PyTorch backend from file: {backend}")
-                return backend
+        parsed = self._read_backend_file()
+        if parsed and parsed[0]:
+            backend = parsed[0]
+            logger.debug("Read PyTorch backend from file: %s", backend)
+            return backend
 
         raise ValueError(
             ".pytorch-backend file not found or empty. "
@@ -74,8 +111,16 @@ class PyTorchBackendManager:
         if versions:
             for pkg, version in versions.items():
                 content += f"\n{pkg}={version}"
-        self.backend_file.write_text(content)
-        logger.info(f"Set PyTorch backend: {backend}")
+
+        if self.backend_file.exists() and self.backend_file.read_text() == content:
+            logger.debug(f"PyTorch backend unchanged: {backend}")
+        else:
+            # Write atomically (temp file + replace) so concurrent readers never see a partial file
+            temp_file = self.backend_file.with_suffix('.tmp')
+            temp_file.write_text(content)
+            temp_file.replace(self.backend_file)
+            self._parsed = None
+            logger.info(f"Set PyTorch backend: {backend}")
 
         # Ensure .gitignore has this entry (migration support)
         self._ensure_gitignore_entry()
@@ -99,10 +144,8 @@ class PyTorchBackendManager:
         Raises:
             PyTorchProbeError: If probing fails
         """
-        from ..utils.pytorch_prober import probe_pytorch_versions
-
         # Probe versions
-        versions, resolved_backend = probe_pytorch_versions(python_version, backend)
+        versions, resolved_backend = pytorch_prober.probe_pytorch_versions(python_version, backend)
 
         # Write backend AND versions to file
         self.set_backend(resolved_backend, versions)
@@ -111,9 +154,8 @@ class PyTorchBackendManager:
 
     def has_backend(self) -> bool:
         """Check if .pytorch-backend file exists and is non-empty."""
-        if not self.backend_file.exists():
-            return False
-        return bool(self.backend_file.read_text().strip())
+        parsed = self._read_backend_file()
+        return bool(parsed and parsed[0])
 
     def ensure_backend(self, python_version: str = "3.12") -> str:
         """Ensure backend is configured, auto-probing if necessary.
@@ -138,43 +180,35 @@ class PyTorchBackendManager:
             Dict mapping package name to version (e.g., {"torch": "2.9.1+cu128"})
             Empty dict if no versions stored or file missing.
         """
-        if not self.backend_file.exists():
-            return {}
-
-        lines = self.backend_file.read_text().strip().split('\n')
-        versions = {}
-
-        # Skip first line (backend), parse remaining as pkg=version
-        for line in lines[1:]:
-            if '=' in line:
-                pkg, version = line.split('=', 1)
-                versions[pkg.strip()] = version.strip()
-
-        return versions
+        parsed = self._read_backend_file()
+        return dict(parsed[1]) if parsed else {}
 
     def _ensure_gitignore_entry(self) -> None:
         """Ensure .pytorch-backend is in .gitignore."""
+        if self._gitignore_checked:
+            return
+
         gitignore_path = self.cec_path / ".gitignore"
         entry = ".pytorch-backend"
 
         if not gitignore_path.exists():
             gitignore_path.write_text(f"# PyTorch backend configuration (machine-specific)\n{entry}\n")
             logger.debug(f"Created .gitignore with entry: {entry}")
+            self._gitignore_checked = True
             return
 
         current_content = gitignore_path.read_text()
 
         # Check if entry already exists
-        for line in current_content.split('\n'):
-            stripped = line.split('#')[0].strip()
-            if stripped == entry:
-                return  # Already present
-
-        # Add entry at the end
-        if not current_content.endswith('\n'):
-            current_content += '\n'
-        current_content += f"\n# PyTorch backend configuration (machine-specific)\n{entry}\n"
-        gitignore_path.write_text(current_content)
+        if _GITIGNORE_ENTRY_RE.search(current_content):
+            self._gitignore_checked = True
+            return  # Already present
+
+        # Append entry at the end
+        prefix = '' if current_content.endswith('\n') else '\n'
+        with open(gitignore_path, 'a') as f:
+            f.write(f"{prefix}\n# PyTorch backend configuration (machine-specific)\n{entry}\n")
+        self._gitignore_checked = True
         logger.info(f"Added {entry} to .gitignore (migration)")
 
     def is_valid_backend(self, backend: str) -> bool:
@@ -186,14 +220,7 @@ class PyTorchBackendManager:
         Returns:
             True if valid, False otherwise
         """
-        if not backend:
-            return False
-
-        for pattern in self.BACKEND_PATTERNS:
-            if re.match(pattern, backend):
-                return True
-
-        return False
+        return bool(backend) and self.BACKEND_PATTERN.fullmatch(backend) is not None
 
     def get_pytorch_config(
         self,
@@ -222,16 +249,18 @@ class PyTorchBackendManager:
         index_url = get_pytorch_index_url(backend)
         index_name = f"pytorch-{backend}"
 
-        sources: dict[str, dict[str, str]] = {}
-        for package in PYTORCH_CORE_PACKAGES:
-            sources[package] = {"index": index_name}
+        sources = {package: {"index": index_name} for package in PYTORCH_CORE_PACKAGES}
 
         # Generate constraints
         constraints: list[str] = []
         if backend_override and python_version:
-            # Probe versions for the override backend to get correct wheel versions
-            from ..utils.pytorch_prober import probe_pytorch_versions
-            versions, _ = probe_pytorch_versions(python_version, backend_override)
+            # Probe versions for the override backend to get correct wheel versions.
+            # Probing is a uv dry-run, so reuse results for repeated injections.
+            probe_key = (python_version, backend_override)
+            versions = self._override_versions.get(probe_key)
+            if versions is None:
+                versions, _ = pytorch_prober.probe_pytorch_versions(python_version, backend_override)
+                self._override_versions[probe_key] = versions
             constraints = [
                 f"{pkg}=={version}"
                 for pkg, version in versions.items()
@@ -259,5 +288,5 @@ class PyTorchBackendManager:
             "constraints": constraints,
         }
 
-        logger.debug(f"Generated PyTorch config for backend {backend}: {config}")
+        logger.debug("Generated PyTorch config for backend %s: %s", backend, config)
         return config
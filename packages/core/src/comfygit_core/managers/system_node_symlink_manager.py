@@ -1,6 +1,8 @@
 """SystemNodeSymlinkManager - Creates symlinks from custom_nodes to workspace system_nodes."""
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import tomlkit
@@ -47,21 +49,19 @@ class SystemNodeSymlinkManager:
             logger.debug("System nodes directory does not exist, skipping")
             return []
 
-        # Ensure custom_nodes directory exists
-        self.custom_nodes_path.mkdir(parents=True, exist_ok=True)
+        # Ensure custom_nodes directory exists (usually does - one stat instead of a failed mkdir)
+        if not self.custom_nodes_path.is_dir():
+            self.custom_nodes_path.mkdir(parents=True, exist_ok=True)
 
         linked = []
-        for node_dir in self.system_nodes_path.iterdir():
-            if not node_dir.is_dir():
-                continue
-
+        for node_dir in self._iter_node_dirs():
             node_name = node_dir.name
             link_path = self.custom_nodes_path / node_name
 
             if link_path.exists():
                 if is_link(link_path):
                     # Already a link - check if pointing to correct target
-                    if link_path.resolve() == node_dir.resolve():
+                    if self._link_points_to(link_path, node_dir):
                         logger.debug(f"System node '{node_name}' already linked correctly")
                         continue
                     else:
@@ -94,21 +94,13 @@ class SystemNodeSymlinkManager:
         if not self.system_nodes_path.exists():
             return results
 
-        for node_dir in self.system_nodes_path.iterdir():
-            if not node_dir.is_dir():
-                continue
-
-            node_name = node_dir.name
-            link_path = self.custom_nodes_path / node_name
-
-            if not link_path.exists():
-                results[node_name] = False
-            elif not is_link(link_path):
-                results[node_name] = False
-            elif link_path.resolve() != node_dir.resolve():
-                results[node_name] = False
-            else:
-                results[node_name] = True
+        for node_dir in self._iter_node_dirs():
+            link_path = self.custom_nodes_path / node_dir.name
+            results[node_dir.name] = (
+                link_path.exists()
+                and is_link(link_path)
+                and self._link_points_to(link_path, node_dir)
+            )
 
         return results
 
@@ -126,15 +118,38 @@ class SystemNodeSymlinkManager:
 
         all_requirements: set[str] = set()
 
-        for node_dir in self.system_nodes_path.iterdir():
-            if not node_dir.is_dir():
-                continue
-
+        for node_dir in self._iter_node_dirs():
             requirements = self._parse_node_requirements(node_dir)
             all_requirements.update(requirements)
 
         return list(all_requirements)
 
+    @staticmethod
+    def _link_points_to(link_path: Path, target: Path) -> bool:
+        """Check whether a link targets the given directory.
+
+        Links are created with the unresolved system node path as target, so a
+        readlink comparison usually settles it in one syscall; anything else
+        (relative targets, junction prefixes) falls back to full resolution.
+        """
+        try:
+            if os.readlink(link_path) == os.fspath(target):
+                return True
+        except OSError:
+            pass
+        return link_path.resolve() == target.resolve()
+
+    def _iter_node_dirs(self) -> Iterator[Path]:
+        """Yield system node directories.
+
+        Uses scandir so the directory check comes from the dirent type
+        rather than a stat call per entry.
+        """
+        with os.scandir(self.system_nodes_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield Path(entry.path)
+
     def _parse_node_requirements(self, node_dir: Path) -> list[str]:
         """Parse requirements from a single system node.
 
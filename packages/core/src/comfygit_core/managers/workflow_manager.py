@@ -4,24 +4,29 @@ from __future__ import annotations
 
 import json
 import shutil
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 from comfygit_core.models.shared import ModelWithLocation
 from comfygit_core.repositories.node_mappings_repository import NodeMappingsRepository
 from comfygit_core.resolvers.global_node_resolver import GlobalNodeResolver
 
 from ..analyzers.workflow_dependency_parser import WorkflowDependencyParser
+from ..configs.model_config import ModelConfig
 from ..logging.logging_config import get_logger
 from ..models.protocols import ModelResolutionStrategy, NodeResolutionStrategy
 from ..models.workflow import (
     DetailedWorkflowStatus,
+    LazyMapping,
     ModelResolutionContext,
     NodeResolutionContext,
     ResolutionResult,
     ResolvedModel,
     ScoredMatch,
-    Workflow,
     WorkflowAnalysisStatus,
     WorkflowNode,
     WorkflowNodeWidgetRef,
@@ -35,6 +40,7 @@ from ..utils.workflow_hash import normalize_workflow
 
 if TYPE_CHECKING:
     from ..caching.workflow_cache import WorkflowCacheRepository
+    from ..models.manifest import ManifestWorkflowModel
     from ..models.workflow import ResolvedNodePackage, WorkflowDependencies
     from ..repositories.model_repository import ModelRepository
     from .pyproject_manager import PyprojectManager
@@ -83,13 +89,32 @@ class WorkflowManager:
         self.comfyui_workflows.mkdir(parents=True, exist_ok=True)
         self.cec_workflows.mkdir(parents=True, exist_ok=True)
 
-        # Create repository and inject into resolver
-        self.global_node_resolver = GlobalNodeResolver(self.node_mapping_repository)
-        self.model_resolver = ModelResolver(model_repository=self.model_repository)
-
         # Use injected model downloader from workspace
         self.downloader = model_downloader
 
+    @cached_property
+    def global_node_resolver(self) -> GlobalNodeResolver:
+        """Node resolver over the injected mappings repository, built on first use."""
+        return GlobalNodeResolver(self.node_mapping_repository)
+
+    @cached_property
+    def model_resolver(self) -> ModelResolver:
+        """Model resolver over the injected model repository, built on first use."""
+        return ModelResolver(model_repository=self.model_repository)
+
+    @cached_property
+    def model_config(self) -> ModelConfig:
+        """Default model config, loaded once for node → directory lookups."""
+        return ModelConfig.load()
+
+    @cached_property
+    def _node_dir_prefixes(self) -> dict[str, tuple[str, ...]]:
+        """Node type → its base directory prefixes ("checkpoints/", ...), built once."""
+        return {
+            node_type: tuple(f"{directory}/" for directory in directories)
+            for node_type, directories in self.model_config.node_directory_mappings.items()
+        }
+
     def _normalize_package_id(self, package_id: str) -> str:
         """Normalize GitHub URLs to registry IDs if they exist in the registry.
 
@@ -646,8 +671,11 @@ class WorkflowManager:
         if installed_nodes is None:
             installed_nodes = set(self.pyproject.nodes.get_existing().keys())
 
-        resolved_packages = set(r.package_id for r in resolution.nodes_resolved if r.package_id)
-        uninstalled_nodes = list(resolved_packages - installed_nodes)
+        # Single pass; dict.fromkeys drops duplicates while keeping resolution order
+        uninstalled_nodes = list(dict.fromkeys(
+            r.package_id for r in resolution.nodes_resolved
+            if r.package_id and r.package_id not in installed_nodes
+        ))
 
         return WorkflowAnalysisStatus(
             name=name,
@@ -657,40 +685,73 @@ class WorkflowManager:
             uninstalled_nodes=uninstalled_nodes
         )
 
-    def get_workflow_status(self) -> DetailedWorkflowStatus:
+    def get_workflow_status(
+        self,
+        sync_status: WorkflowSyncStatus | None = None
+    ) -> DetailedWorkflowStatus:
         """Get detailed workflow status with full dependency analysis.
 
         Analyzes ALL workflows in ComfyUI directory, checking dependencies
         and resolution status. This is read-only - no copying to .cec.
 
+        Args:
+            sync_status: Sync status the caller already computed (avoids re-comparing workflows)
+
         Returns:
             DetailedWorkflowStatus with sync status and analysis for each workflow
         """
-        sync_status = self.get_workflow_sync_status()
+        if sync_status is None:
+            sync_status = self.get_workflow_sync_status()
         installed_nodes = set(self.pyproject.nodes.get_existing().keys())
 
         all_workflow_names = sync_status.new + sync_status.modified + sync_status.synced
-        analyzed: list[WorkflowAnalysisStatus] = []
-
-        for name in all_workflow_names:
-            if name in sync_status.new:
-                state = "new"
-            elif name in sync_status.modified:
-                state = "modified"
-            else:
-                state = "synced"
-
+        # name → sync state; a name listed twice keeps its first (highest-priority) state
+        state_by_name: dict[str, str] = {}
+        for state, names in (
+            ("new", sync_status.new),
+            ("modified", sync_status.modified),
+            ("synced", sync_status.synced),
+        ):
+            for name in names:
+                state_by_name.setdefault(name, state)
+
+        def analyze(name: str) -> WorkflowAnalysisStatus | None:
             try:
-                analysis = self.analyze_single_workflow_status(name, state, installed_nodes)
-                analyzed.append(analysis)
+                return self.analyze_single_workflow_status(name, state_by_name[name], installed_nodes)
             except Exception as e:
                 logger.error(f"Failed to analyze workflow {name}: {e}")
+                return None
+
+        # Workflows are analyzed independently (file parsing, cache and registry I/O),
+        # so run them on a pool; map() keeps results in workflow order
+        if len(all_workflow_names) > 1:
+            self._warm_shared_resolvers()
+            with ThreadPoolExecutor(max_workers=min(16, len(all_workflow_names))) as executor:
+                results = list(executor.map(analyze, all_workflow_names))
+        else:
+            results = [analyze(name) for name in all_workflow_names]
 
         return DetailedWorkflowStatus(
             sync_status=sync_status,
-            analyzed_workflows=analyzed
+            analyzed_workflows=[analysis for analysis in results if analysis is not None]
         )
 
+    def _warm_shared_resolvers(self) -> None:
+        """Build lazily-loaded resolver state before worker threads share it.
+
+        cached_property has no lock, so concurrent first accesses would each
+        re-parse the registry mappings and model config. Failures are left for
+        the per-workflow analysis to report.
+        """
+        try:
+            _ = (
+                self.global_node_resolver.global_mappings,
+                self.model_resolver.model_config,
+                self.model_config,
+            )
+        except Exception as e:
+            logger.debug(f"Could not preload resolver data: {e}")
+
     def analyze_workflow(self, name: str) -> WorkflowDependencies:
         """Analyze a single workflow for dependencies - with caching.
 
@@ -792,6 +853,20 @@ class WorkflowManager:
 
         return (dependencies, resolution)
 
+    def _lazy_global_models(self, config: dict | None = None) -> LazyMapping:
+        """Global models table (hash → ManifestModel) for download intent creation.
+
+        The table is only read from pyproject if a resolution strategy consults it.
+        """
+        def load() -> dict:
+            try:
+                return {model.hash: model for model in self.pyproject.models.get_all(config=config)}
+            except Exception as e:
+                logger.warning(f"Failed to load global models table: {e}")
+                return {}
+
+        return LazyMapping(load)
+
     def resolve_workflow(self, analysis: WorkflowDependencies) -> ResolutionResult:
         """Attempt automatic resolution of workflow dependencies.
 
@@ -818,18 +893,22 @@ class WorkflowManager:
 
         workflow_name = analysis.workflow_name
 
-        # Load workflow JSON for path comparison
+        # Path sync only applies to workflows still present in ComfyUI; the analysis
+        # already holds every widget value, so the JSON isn't parsed a second time
         try:
-            workflow_path = self.get_workflow_path(workflow_name)
-            workflow = WorkflowRepository.load(workflow_path)
+            self.get_workflow_path(workflow_name)
+            workflow_exists = True
         except FileNotFoundError:
-            workflow = None
+            workflow_exists = False
             logger.warning(f"Could not load workflow '{workflow_name}' for path sync check")
 
+        # Read-only pass: every pyproject lookup below shares one loaded config
+        config = self.pyproject.load()
+
         # Build node resolution context with per-workflow custom_node_map
         node_context = NodeResolutionContext(
-            installed_packages=self.pyproject.nodes.get_existing(),
-            custom_mappings=self.pyproject.workflows.get_custom_node_map(workflow_name),
+            installed_packages=self.pyproject.nodes.get_existing(config=config),
+            custom_mappings=self.pyproject.workflows.get_custom_node_map(workflow_name, config=config),
             workflow_name=workflow_name,
             auto_select_ambiguous=True # TODO: Make configurable
         )
@@ -850,16 +929,16 @@ class WorkflowManager:
 
         # Resolve each unique node type with context
         for node_type, node in unique_nodes.items():
-            logger.debug(f"Trying to resolve node: {node}")
+            logger.debug("Trying to resolve node: %s", node)
             resolved_packages = self.global_node_resolver.resolve_single_node_with_context(node, node_context)
 
             if resolved_packages is None:
                 # Not resolved - trigger strategy
-                logger.debug(f"Node not found: {node}")
+                logger.debug("Node not found: %s", node)
                 nodes_unresolved.append(node)
             elif len(resolved_packages) == 1:
                 # Single match - cleanly resolved
-                logger.debug(f"Resolved node: {resolved_packages[0]}")
+                logger.debug("Resolved node: %s", resolved_packages[0])
                 nodes_resolved.append(resolved_packages[0])
             else:
                 # Multiple matches from registry (ambiguous)
@@ -867,39 +946,33 @@ class WorkflowManager:
 
         # Build context with full ManifestWorkflowModel objects
         # This enables download intent detection and other advanced resolution logic
-        previous_resolutions = {}
-        workflow_models = self.pyproject.workflows.get_workflow_models(workflow_name)
+        workflow_models = self.pyproject.workflows.get_workflow_models(workflow_name, config=config)
 
-        for manifest_model in workflow_models:
-            # Store full ManifestWorkflowModel object for each node reference
-            # This provides access to hash, sources, status, relative_path, etc.
-            for ref in manifest_model.nodes:
-                previous_resolutions[ref] = manifest_model
+        # Store full ManifestWorkflowModel object for each node reference
+        # This provides access to hash, sources, status, relative_path, etc.
+        previous_resolutions = {
+            ref: manifest_model for manifest_model in workflow_models for ref in manifest_model.nodes
+        }
 
-        # Get global models table for download intent creation
-        global_models_dict = {}
-        try:
-            all_global_models = self.pyproject.models.get_all()
-            for model in all_global_models:
-                global_models_dict[model.hash] = model
-        except Exception as e:
-            logger.warning(f"Failed to load global models table: {e}")
+        # One pass over the model index serves both fallback strategies
+        models_by_filename, models_by_path_lower = (
+            self.model_resolver.build_model_indexes() if analysis.found_models else (None, None)
+        )
 
         model_context = ModelResolutionContext(
             workflow_name=workflow_name,
             previous_resolutions=previous_resolutions,
-            global_models=global_models_dict,
-            auto_select_ambiguous=True # TODO: Make configurable
+            global_models=self._lazy_global_models(config),
+            auto_select_ambiguous=True, # TODO: Make configurable
+            models_by_filename=models_by_filename,
+            models_by_path_lower=models_by_path_lower,
         )
 
         # Deduplicate model refs by (widget_value, node_type) before resolving
         # This ensures status reporting shows accurate counts (not inflated by duplicates)
         model_groups: dict[tuple[str, str], list[WorkflowNodeWidgetRef]] = {}
         for model_ref in analysis.found_models:
-            key = (model_ref.widget_value, model_ref.node_type)
-            if key not in model_groups:
-                model_groups[key] = []
-            model_groups[key].append(model_ref)
+            model_groups.setdefault((model_ref.widget_value, model_ref.node_type), []).append(model_ref)
 
         # Resolve each unique model group (one resolution per unique model)
         for (widget_value, node_type), refs_in_group in model_groups.items():
@@ -910,37 +983,45 @@ class WorkflowManager:
 
             if result is None:
                 # Model not found at all - add primary ref only (deduplicated)
-                logger.debug(f"Failed to resolve model: {primary_ref}")
+                logger.debug("Failed to resolve model: %s", primary_ref)
                 models_unresolved.append(primary_ref)
             elif len(result) == 1:
                 # Clean resolution (exact match or from pyproject cache)
                 resolved_model = result[0]
 
                 # Check if path needs syncing (only for builtin nodes with resolved models)
-                if workflow and resolved_model.resolved_model:
+                if workflow_exists and resolved_model.resolved_model:
                     resolved_model.needs_path_sync = self._check_path_needs_sync(
-                        resolved_model,
-                        workflow
+                        resolved_model, model_context
                     )
 
-                # Check category mismatch (functional issue - model in wrong directory)
-                if resolved_model.resolved_model:
-                    has_mismatch, expected, actual = self._check_category_mismatch(resolved_model)
-                    resolved_model.has_category_mismatch = has_mismatch
-                    resolved_model.expected_categories = expected
-                    resolved_model.actual_category = actual
-
-                logger.debug(f"Resolved model: {resolved_model}")
+                logger.debug("Resolved model: %s", resolved_model)
                 models_resolved.append(resolved_model)
             elif len(result) > 1:
                 # Ambiguous - multiple matches (use primary ref)
-                logger.debug(f"Ambiguous model: {result}")
+                logger.debug("Ambiguous model: %s", result)
                 models_ambiguous.append(result)
             else:
                 # No resolution possible - add primary ref only (deduplicated)
-                logger.debug(f"Failed to resolve model: {primary_ref}, result: {result}")
+                logger.debug("Failed to resolve model: %s, result: %s", primary_ref, result)
                 models_unresolved.append(primary_ref)
 
+        # Check category mismatch (functional issue - model in wrong directory).
+        # Other locations are only needed for models outside their expected
+        # directories; the first such model fetches them for the whole batch.
+        resolved_hashes = {r.resolved_model.hash for r in models_resolved if r.resolved_model}
+        locations_by_hash = LazyMapping(
+            lambda: self.model_repository.get_locations_for_hashes(resolved_hashes)
+        )
+        for resolved_model in models_resolved:
+            if resolved_model.resolved_model:
+                has_mismatch, expected, actual = self._check_category_mismatch(
+                    resolved_model, locations_by_hash
+                )
+                resolved_model.has_category_mismatch = has_mismatch
+                resolved_model.expected_categories = expected
+                resolved_model.actual_category = actual
+
         return ResolutionResult(
             workflow_name=workflow_name,
             nodes_resolved=nodes_resolved,
@@ -991,10 +1072,11 @@ class WorkflowManager:
             remaining_nodes_ambiguous = list(resolution.nodes_ambiguous)
             remaining_nodes_unresolved = list(resolution.nodes_unresolved)
         else:
-            # Build context with search function
+            # Build context with search function (both lookups share one loaded config)
+            config = self.pyproject.load()
             node_context = NodeResolutionContext(
-                installed_packages=self.pyproject.nodes.get_existing(),
-                custom_mappings=self.pyproject.workflows.get_custom_node_map(workflow_name),
+                installed_packages=self.pyproject.nodes.get_existing(config=config),
+                custom_mappings=self.pyproject.workflows.get_custom_node_map(workflow_name, config=config),
                 workflow_name=workflow_name,
                 search_fn=self.global_node_resolver.search_packages,
                 auto_select_ambiguous=True  # TODO: Make configurable
@@ -1076,19 +1158,10 @@ class WorkflowManager:
             remaining_models_ambiguous = list(resolution.models_ambiguous)
             remaining_models_unresolved = list(resolution.models_unresolved)
         else:
-            # Get global models table for download intent creation
-            global_models_dict = {}
-            try:
-                all_global_models = self.pyproject.models.get_all()
-                for model in all_global_models:
-                    global_models_dict[model.hash] = model
-            except Exception as e:
-                logger.warning(f"Failed to load global models table: {e}")
-
             # Build context with search function and downloader
             model_context = ModelResolutionContext(
                 workflow_name=workflow_name,
-                global_models=global_models_dict,
+                global_models=self._lazy_global_models(),
                 search_fn=self.search_models,
                 downloader=self.downloader,
                 auto_select_ambiguous=True  # TODO: Make configurable
@@ -1114,9 +1187,7 @@ class WorkflowManager:
                 # Group key: (widget_value, node_type)
                 # This ensures same model in same loader type gets resolved once
                 key = (model_ref.widget_value, model_ref.node_type)
-                if key not in model_groups:
-                    model_groups[key] = []
-                model_groups[key].append((model_ref, candidates))
+                model_groups.setdefault(key, []).append((model_ref, candidates))
 
             # Resolve each group (one prompt per unique model)
             for (widget_value, node_type), group in model_groups.items():
@@ -1194,7 +1265,8 @@ class WorkflowManager:
     def apply_resolution(
         self,
         resolution: ResolutionResult,
-        config: dict | None = None
+        config: dict | None = None,
+        update_paths: bool = True
     ) -> None:
         """Apply resolutions with smart defaults and reconciliation.
 
@@ -1203,6 +1275,8 @@ class WorkflowManager:
         Args:
             resolution: Result with auto-resolved dependencies from resolve_workflow()
             config: Optional in-memory config for batched writes. If None, loads and saves immediately.
+            update_paths: Rewrite workflow JSON paths now. Batched callers pass False and
+                hand the resolutions to update_workflow_model_paths_batch() afterwards.
         """
         from comfygit_core.models.manifest import ManifestModel, ManifestWorkflowModel
 
@@ -1372,7 +1446,8 @@ class WorkflowManager:
             self.pyproject.save(config)
 
         # Phase 3: Update workflow JSON with resolved paths
-        self.update_workflow_model_paths(resolution)
+        if update_paths:
+            self.update_workflow_model_paths(resolution)
 
     def update_workflow_model_paths(
         self,
@@ -1394,15 +1469,70 @@ class WorkflowManager:
         Raises:
             FileNotFoundError if workflow not found
         """
+        if self._write_workflow_model_paths(resolution):
+            # Invalidate cache since workflow content changed
+            self.workflow_cache.invalidate(
+                env_name=self.environment_name,
+                workflow_name=resolution.workflow_name
+            )
+
+        # Note: We intentionally do NOT update .cec here
+        # The .cec copy represents "committed state" and should only be updated during commit
+        # This ensures workflow status correctly shows as "new" or "modified" until committed
+
+    def update_workflow_model_paths_batch(
+        self,
+        resolutions: list[ResolutionResult]
+    ) -> None:
+        """Update workflow JSON files for several workflows concurrently.
+
+        Each workflow is an independent file, so the load/rewrite/save work runs on
+        a thread pool. Cache invalidation touches shared state (SQLite and the
+        session cache) and is applied on the calling thread once all writes finish.
+
+        Args:
+            resolutions: Resolution results, one per workflow
+        """
+        if len(resolutions) <= 1:
+            for resolution in resolutions:
+                self.update_workflow_model_paths(resolution)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(resolutions))) as executor:
+            written = list(executor.map(self._write_workflow_model_paths, resolutions))
+
+        for resolution, was_written in zip(resolutions, written, strict=True):
+            if was_written:
+                self.workflow_cache.invalidate(
+                    env_name=self.environment_name,
+                    workflow_name=resolution.workflow_name
+                )
+
+    def _write_workflow_model_paths(self, resolution: ResolutionResult) -> bool:
+        """Rewrite resolved model paths in a workflow JSON file.
+
+        Returns:
+            True if the workflow file was saved
+        """
         workflow_name = resolution.workflow_name
 
         # Load workflow from ComfyUI directory
         workflow_path = self.get_workflow_path(workflow_name)
 
+        # Nothing to write back - skip parsing the workflow at all
+        if not any(resolved.resolved_model for resolved in resolution.models_resolved):
+            logger.debug(f"No path updates needed for workflow '{workflow_name}'")
+            return False
+
         workflow = WorkflowRepository.load(workflow_path)
 
         updated_count = 0
         skipped_count = 0
+        # (node_type, relative_path) → stripped path; models often repeat across nodes
+        display_paths: dict[tuple[str, str], str] = {}
+        # Loop invariants, bound once
+        is_loader_node = self.model_resolver.model_config.is_model_loader_node
+        workflow_nodes = workflow.nodes
 
         # Update each resolved model's path in the workflow
         for resolved in resolution.models_resolved:
@@ -1417,47 +1547,43 @@ class WorkflowManager:
             widget_idx = ref.widget_index
 
             # Skip custom nodes - they have undefined path behavior
-            if not self.model_resolver.model_config.is_model_loader_node(ref.node_type):
+            if not is_loader_node(ref.node_type):
                 logger.debug(
-                    f"Skipping path update for custom node '{ref.node_type}' "
-                    f"(node_id={node_id}, widget={widget_idx}). "
-                    f"Custom nodes manage their own model paths."
+                    "Skipping path update for custom node '%s' (node_id=%s, widget=%s). "
+                    "Custom nodes manage their own model paths.",
+                    ref.node_type, node_id, widget_idx
                 )
                 skipped_count += 1
                 continue
 
             # Update the node's widget value with resolved path
-            if node_id in workflow.nodes:
-                node = workflow.nodes[node_id]
-                if widget_idx < len(node.widgets_values):
-                    old_path = node.widgets_values[widget_idx]
+            node = workflow_nodes.get(node_id)
+            if node is not None:
+                widgets = node.widgets_values
+                if widget_idx < len(widgets):
+                    old_path = widgets[widget_idx]
                     # Strip base directory prefix for ComfyUI BUILTIN node loaders
                     # e.g., "checkpoints/sd15/model.ckpt" → "sd15/model.ckpt"
-                    display_path = self._strip_base_directory_for_node(ref.node_type, model.relative_path)
-                    node.widgets_values[widget_idx] = display_path
-                    logger.debug(f"Updated node {node_id} widget {widget_idx}: {old_path} → {display_path}")
+                    key = (ref.node_type, model.relative_path)
+                    display_path = display_paths.get(key)
+                    if display_path is None:
+                        display_path = self._strip_base_directory_for_node(*key)
+                        display_paths[key] = display_path
+                    widgets[widget_idx] = display_path
+                    logger.debug("Updated node %s widget %s: %s → %s", node_id, widget_idx, old_path, display_path)
                     updated_count += 1
 
         # Only save if we actually updated something
         if updated_count > 0:
             WorkflowRepository.save(workflow, workflow_path)
-
-            # Invalidate cache since workflow content changed
-            self.workflow_cache.invalidate(
-                env_name=self.environment_name,
-                workflow_name=workflow_name
-            )
-
             logger.info(
                 f"Updated workflow JSON: {workflow_path} "
                 f"({updated_count} builtin nodes updated, {skipped_count} custom nodes preserved)"
             )
-        else:
-            logger.debug(f"No path updates needed for workflow '{workflow_name}'")
+            return True
 
-        # Note: We intentionally do NOT update .cec here
-        # The .cec copy represents "committed state" and should only be updated during commit
-        # This ensures workflow status correctly shows as "new" or "modified" until committed
+        logger.debug(f"No path updates needed for workflow '{workflow_name}'")
+        return False
 
     def _get_default_criticality(self, category: str) -> str:
         """Determine smart default criticality based on model category.
@@ -1483,25 +1609,26 @@ class WorkflowManager:
         node_type = node_ref.node_type
         directories = self.model_resolver.model_config.get_directories_for_node(node_type)
         if directories:
-            logger.debug(f"Found directory mapping for node type '{node_type}': {directories}")
+            logger.debug("Found directory mapping for node type '%s': %s", node_type, directories)
             return directories[0]  # Use first directory as category
 
         # Next check if widget value path can be converted to category:
         from ..utils.model_categories import get_model_category
         category = get_model_category(node_ref.widget_value)
-        logger.debug(f"Found directory mapping for widget value '{node_ref.widget_value}': {category}")
+        logger.debug("Found directory mapping for widget value '%s': %s", node_ref.widget_value, category)
         return category
 
     def _check_path_needs_sync(
         self,
         resolved: ResolvedModel,
-        workflow: Workflow
+        model_context: ModelResolutionContext | None = None
     ) -> bool:
         """Check if a resolved model's path differs from workflow JSON.
 
         Args:
             resolved: ResolvedModel with reference and resolved_model
-            workflow: Loaded workflow JSON
+            model_context: Resolution context whose batch model index, when built,
+                           answers the exact-path lookups without a query per path
 
         Returns:
             True if workflow path differs from expected resolved path
@@ -1526,35 +1653,31 @@ class WorkflowManager:
         # Normalize current path for comparison (handles Windows backslashes)
         current_path = ref.widget_value.replace('\\', '/')
 
-        # If paths differ, check if current path exists with same hash (duplicate models)
-        if current_path != expected_path:
-            # Try to find the current path in model repository
-            # For builtin loaders, we need to reconstruct the full path
-            all_models = self.model_repository.get_all_models()
-
-            # Try exact match with current path
-            current_matches = self.model_resolver._try_exact_match(current_path, all_models)
-
-            # If not found, try reconstructing the path (for builtin loaders)
-            if not current_matches and self.model_resolver.model_config.is_model_loader_node(ref.node_type):
-                reconstructed_paths = self.model_resolver.model_config.reconstruct_model_path(
-                    ref.node_type, current_path
-                )
-                for path in reconstructed_paths:
-                    current_matches = self.model_resolver._try_exact_match(path, all_models)
-                    if current_matches:
-                        break
-
-            # If current path exists and has same hash as resolved model, no sync needed
-            if current_matches and current_matches[0].hash == model.hash:
-                return False
+        # Common case: workflow already points at the resolved model's display path
+        if current_path == expected_path:
+            return False
 
-        # Return True if paths differ and current path is invalid or has different hash
-        return current_path != expected_path
+        # Paths differ - check if current path exists with same hash (duplicate models).
+        # Builtin loaders store paths without their base directory, so try the
+        # reconstructed full paths first, then the raw value.
+        find_exact = self.model_resolver.find_exact
+        candidate_paths = [
+            *self.model_resolver.reconstruct_model_path(ref.node_type, current_path),
+            current_path,
+        ]
+        for path in candidate_paths:
+            current_matches = find_exact(path, model_context)
+            if current_matches:
+                # Same model at the current path - no sync needed
+                return current_matches[0].hash != model.hash
+
+        # Current path is invalid
+        return True
 
     def _check_category_mismatch(
         self,
         resolved: ResolvedModel,
+        locations_by_hash: Mapping[str, list[dict]] | None = None,
     ) -> tuple[bool, list[str], str | None]:
         """Check if model is in wrong category directory for its loader node.
 
@@ -1567,6 +1690,8 @@ class WorkflowManager:
 
         Args:
             resolved: ResolvedModel with reference and resolved_model
+            locations_by_hash: Batch-loaded model hash → locations; when None,
+                               the model's locations are queried directly
 
         Returns:
             Tuple of (has_mismatch, expected_categories, actual_category)
@@ -1587,21 +1712,24 @@ class WorkflowManager:
         if not expected_dirs:
             return (False, [], None)
 
+        expected_set = frozenset(expected_dirs)
+
         # Extract actual category from resolved model path (first path component)
-        path_parts = model.relative_path.replace('\\', '/').split('/')
-        actual_category = path_parts[0] if path_parts else None
+        actual_category = model.relative_path.replace('\\', '/').partition('/')[0]
 
         # If resolved location is in expected directory, no mismatch
-        if actual_category in expected_dirs:
+        if actual_category in expected_set:
             return (False, expected_dirs, actual_category)
 
         # Resolved location is wrong, but check if model exists in ANY valid location
         # This handles the case where user copied (not moved) the model
-        all_locations = self.model_repository.get_locations(model.hash)
+        if locations_by_hash is None:
+            all_locations = self.model_repository.get_locations(model.hash)
+        else:
+            all_locations = locations_by_hash.get(model.hash, [])
         for location in all_locations:
-            loc_path_parts = location['relative_path'].replace('\\', '/').split('/')
-            loc_category = loc_path_parts[0] if loc_path_parts else None
-            if loc_category in expected_dirs:
+            loc_category = location['relative_path'].replace('\\', '/').partition('/')[0]
+            if loc_category in expected_set:
                 # Model exists in a valid location - no functional mismatch
                 return (False, expected_dirs, actual_category)
 
@@ -1640,24 +1768,20 @@ class WorkflowManager:
             >>> _strip_base_directory_for_node("CheckpointLoaderSimple", "checkpoints/a/b/c/model.ckpt")
             "a/b/c/model.ckpt"  # Subdirectories preserved
         """
-        from ..configs.model_config import ModelConfig
-
         # Normalize to forward slashes for cross-platform compatibility (Windows uses backslashes)
         relative_path = relative_path.replace('\\', '/')
 
-        model_config = ModelConfig.load()
-        base_dirs = model_config.get_directories_for_node(node_type)
+        prefixes = self._node_dir_prefixes.get(node_type)
 
         # Warn if called for custom node (should be skipped in caller)
-        if not base_dirs:
+        if not prefixes:
             logger.warning(
                 f"_strip_base_directory_for_node called for unknown/custom node type: {node_type}. "
                 f"Custom nodes should skip path updates entirely. Returning path unchanged."
             )
             return relative_path
 
-        for base_dir in base_dirs:
-            prefix = base_dir + "/"
+        for prefix in prefixes:
             if relative_path.startswith(prefix):
                 # Strip the base directory but preserve subdirectories
                 return relative_path[len(prefix):]
@@ -1685,12 +1809,9 @@ class WorkflowManager:
         """
         from difflib import SequenceMatcher
 
-        from ..configs.model_config import ModelConfig
-
         # If node_type provided, filter by category
         if node_type:
-            model_config = ModelConfig.load()
-            directories = model_config.get_directories_for_node(node_type)
+            directories = self.model_config.get_directories_for_node(node_type)
 
             if directories:
                 # Get models from all relevant categories
@@ -1763,53 +1884,77 @@ class WorkflowManager:
         Raises:
             ValueError: If new_criticality is not valid
         """
+        return self.update_model_criticalities(
+            workflow_name, {model_identifier: new_criticality}
+        )[model_identifier]
+
+    def update_model_criticalities(
+        self,
+        workflow_name: str,
+        updates: dict[str, str]
+    ) -> dict[str, bool]:
+        """Update criticality for several models in a workflow with one load and save.
+
+        Args:
+            workflow_name: Workflow to update
+            updates: Model identifier (filename or hash) → new criticality
+
+        Returns:
+            Identifier → True if at least one model matched it
+
+        Raises:
+            ValueError: If any new criticality is not valid
+        """
         # Validate criticality
-        if new_criticality not in ("required", "flexible", "optional"):
-            raise ValueError(f"Invalid criticality: {new_criticality}")
+        for new_criticality in updates.values():
+            if new_criticality not in ("required", "flexible", "optional"):
+                raise ValueError(f"Invalid criticality: {new_criticality}")
+
+        found = dict.fromkeys(updates, False)
 
         # Load workflow models
         models = self.pyproject.workflows.get_workflow_models(workflow_name)
-
         if not models:
-            return False
-
-        # Find matching model(s)
-        matches = []
-        for i, model in enumerate(models):
-            if model.hash == model_identifier or model.filename == model_identifier:
-                matches.append((i, model))
+            return found
+
+        # Hash and filename → matching models
+        models_by_identifier: dict[str, list[ManifestWorkflowModel]] = {}
+        for model in models:
+            for key in {model.hash, model.filename}:
+                if key:
+                    models_by_identifier.setdefault(key, []).append(model)
+
+        changed = False
+        for identifier, new_criticality in updates.items():
+            matches = models_by_identifier.get(identifier)
+            if not matches:
+                continue
 
-        if not matches:
-            return False
+            found[identifier] = True
+            for model in matches:
+                if model.criticality == new_criticality:
+                    continue
+                logger.info(
+                    f"Updated '{model.filename}' criticality: "
+                    f"{model.criticality} → {new_criticality}"
+                )
+                model.criticality = new_criticality
+                changed = True
 
-        # If single match, update directly
-        if len(matches) == 1:
-            idx, model = matches[0]
-            old_criticality = model.criticality
-            models[idx].criticality = new_criticality
+        # Skip the write entirely when nothing actually changed
+        if changed:
             self.pyproject.workflows.set_workflow_models(workflow_name, models)
-            logger.info(
-                f"Updated '{model.filename}' criticality: "
-                f"{old_criticality} → {new_criticality}"
-            )
-            return True
-
-        # Multiple matches - update all and return True
-        for idx, model in matches:
-            models[idx].criticality = new_criticality
+            self.workflow_cache.invalidate_resolution(self.environment_name, workflow_name)
 
-        self.pyproject.workflows.set_workflow_models(workflow_name, models)
-        logger.info(
-            f"Updated {len(matches)} model(s) with identifier '{model_identifier}' "
-            f"to criticality '{new_criticality}'"
-        )
-        return True
+        return found
 
     def _update_model_hash(
         self,
         workflow_name: str,
         reference: WorkflowNodeWidgetRef,
-        new_hash: str
+        new_hash: str,
+        config: dict | None = None,
+        resolved_model: ModelWithLocation | None = None
     ) -> None:
         """Update hash for a model after download completes.
 
@@ -1820,71 +1965,117 @@ class WorkflowManager:
             workflow_name: Workflow containing the model
             reference: Widget reference to identify the model
             new_hash: Hash of downloaded model
+            config: Optional in-memory config for batched writes. If None, loads and saves immediately.
+            resolved_model: Indexed model for new_hash if the caller already has it
+                (skips the repository lookup)
 
         Raises:
             ValueError: If model not found in workflow or repository
         """
-        from comfygit_core.models.manifest import ManifestModel
+        is_batch = config is not None
+        if not is_batch:
+            config = self.pyproject.load()
 
         # Load workflow models
-        models = self.pyproject.workflows.get_workflow_models(workflow_name)
+        models = self.pyproject.workflows.get_workflow_models(workflow_name, config=config)
 
         # Find model matching the reference
-        for idx, model in enumerate(models):
-            if reference in model.nodes:
-                # Capture download metadata before clearing
-                download_sources = model.sources if model.sources else []
-
-                # STEP 1: Get model from repository (should always exist after download)
-                resolved_model = self.model_repository.get_model(new_hash)
-                if not resolved_model:
-                    raise ValueError(
-                        f"Model {new_hash} not found in repository after download. "
-                        f"This indicates the model wasn't properly indexed."
-                    )
+        model = next((m for m in models if reference in m.nodes), None)
+        if model is None:
+            raise ValueError(f"Model with reference {reference} not found in workflow '{workflow_name}'")
 
-                # STEP 2: Create global table entry FIRST (before clearing workflow model)
-                manifest_model = ManifestModel(
-                    hash=new_hash,
-                    filename=resolved_model.filename,
-                    relative_path=resolved_model.relative_path,
-                    category=model.category,
-                    size=resolved_model.file_size,
-                    sources=download_sources
-                )
-                self.pyproject.models.add_model(manifest_model)
+        if not self._apply_model_hash(model, new_hash, config, resolved_model):
+            return
+
+        # Save workflow models
+        self.pyproject.workflows.set_workflow_models(workflow_name, models, config=config)
+        if not is_batch:
+            self.pyproject.save(config)
+        self.workflow_cache.invalidate_resolution(self.environment_name, workflow_name)
+
+    def _apply_model_hash(
+        self,
+        model: ManifestWorkflowModel,
+        new_hash: str,
+        config: dict,
+        resolved_model: ModelWithLocation | None = None
+    ) -> bool:
+        """Resolve a download-intent workflow model in place and add its global entry.
 
-                # STEP 3: Update workflow model (clear transient fields, set hash)
-                models[idx].hash = new_hash
-                models[idx].status = "resolved"
-                models[idx].sources = []
-                models[idx].relative_path = None
+        The caller writes the workflow model list back with set_workflow_models().
 
-                # STEP 4: Save workflow models
-                self.pyproject.workflows.set_workflow_models(workflow_name, models)
+        Returns:
+            False if the model was already resolved to new_hash (nothing changed)
 
-                logger.info(f"Updated model '{model.filename}' with hash {new_hash}")
-                return
+        Raises:
+            ValueError: If the model is not in the repository
+        """
+        from comfygit_core.models.manifest import ManifestModel
+
+        # Already applied (duplicate intent or re-run) - global entry exists, sources cleared
+        if model.hash == new_hash and model.status == "resolved":
+            logger.debug(f"Model '{model.filename}' already resolved to {new_hash}")
+            return False
 
-        raise ValueError(f"Model with reference {reference} not found in workflow '{workflow_name}'")
+        # Capture download metadata before clearing
+        download_sources = model.sources if model.sources else []
+
+        # STEP 1: Get model from repository (should always exist after download)
+        if resolved_model is None:
+            resolved_model = self.model_repository.get_model(new_hash)
+        if not resolved_model:
+            raise ValueError(
+                f"Model {new_hash} not found in repository after download. "
+                f"This indicates the model wasn't properly indexed."
+            )
+
+        # STEP 2: Create global table entry FIRST (before clearing workflow model)
+        manifest_model = ManifestModel(
+            hash=new_hash,
+            filename=resolved_model.filename,
+            relative_path=resolved_model.relative_path,
+            category=model.category,
+            size=resolved_model.file_size,
+            sources=download_sources
+        )
+        self.pyproject.models.add_model(manifest_model, config=config)
+
+        # STEP 3: Update workflow model (clear transient fields, set hash)
+        model.hash = new_hash
+        model.status = "resolved"
+        model.sources = []
+        model.relative_path = None
+
+        logger.info(f"Updated model '{model.filename}' with hash {new_hash}")
+        return True
 
     def execute_pending_downloads(
         self,
         result: ResolutionResult,
-        callbacks: BatchDownloadCallbacks | None = None
+        callbacks: BatchDownloadCallbacks | None = None,
+        max_workers: int = 4
     ) -> list:
         """Execute batch downloads for all download intents in result.
 
         All user-facing output is delivered via callbacks.
 
+        Downloads run concurrently (up to max_workers) when no per-file progress
+        callback is set. Progress reports carry no filename, so with a progress
+        renderer attached downloads stay sequential.
+
+        Intents with no usable source or target are failed up front (reported via
+        on_file_complete) and are not counted in the batch start/complete totals.
+
         Args:
             result: Resolution result containing download intents
             callbacks: Optional callbacks for progress/status (provided by CLI)
+            max_workers: Maximum concurrent downloads when running without progress output
 
         Returns:
             List of DownloadResult objects
         """
         from ..models.workflow import DownloadResult
+        from ..services.model_downloader import DownloadRequest
 
         # Collect download intents
         intents = [r for r in result.models_resolved if r.match_type == "download_intent"]
@@ -1892,90 +2083,176 @@ class WorkflowManager:
         if not intents:
             return []
 
-        # Notify batch start
-        if callbacks and callbacks.on_batch_start:
-            callbacks.on_batch_start(len(intents))
+        # URL → model already in the index (one batched query) or downloaded during this batch
+        models_by_url: dict[str, ModelWithLocation] = self.model_repository.find_by_source_urls(
+            {r.model_source for r in intents if r.model_source}
+        )
 
-        results = []
-        for idx, resolved in enumerate(intents, 1):
+        # Fail intents that can neither be downloaded nor reused before any work starts,
+        # so the batch totals only count intents that can actually complete.
+        # Results are slotted by intent position so they come back in intent order.
+        downloadable_urls = {r.model_source for r in intents if r.model_source and r.target_path}
+        results: list[DownloadResult | None] = [None] * len(intents)
+        batch: list[tuple[int, ResolvedModel]] = []
+        for pos, resolved in enumerate(intents):
+            source = resolved.model_source
+            if source and (source in models_by_url or source in downloadable_urls):
+                batch.append((pos, resolved))
+                continue
             filename = resolved.reference.widget_value
+            error_msg = "Download intent missing target_path or model_source"
+            logger.warning(f"Skipping download of '{filename}': {error_msg}")
+            if callbacks and callbacks.on_file_complete:
+                callbacks.on_file_complete(filename, False, error_msg)
+            results[pos] = DownloadResult(success=False, filename=filename, error=error_msg)
 
-            # Notify file start
-            if callbacks and callbacks.on_file_start:
-                callbacks.on_file_start(filename, idx, len(intents))
+        # Target-less intents can only reuse another intent's download, so process
+        # every intent that downloads first (stable sort keeps the rest in order)
+        batch.sort(key=lambda item: not item[1].target_path)
 
-            # Check if already downloaded (deduplication)
-            if resolved.model_source:
-                existing = self.model_repository.find_by_source_url(resolved.model_source)
-                if existing:
-                    # Reuse existing model - update pyproject with hash
-                    self._update_model_hash(
-                        result.workflow_name,
-                        resolved.reference,
-                        existing.hash
-                    )
-                    # Notify success (reused existing)
-                    if callbacks and callbacks.on_file_complete:
-                        callbacks.on_file_complete(filename, True, None)
-                    results.append(DownloadResult(
-                        success=True,
-                        filename=filename,
-                        model=existing,
-                        reused=True
-                    ))
-                    continue
+        if not batch:
+            return results
 
-            # Validate required fields
-            if not resolved.target_path or not resolved.model_source:
-                error_msg = "Download intent missing target_path or model_source"
-                if callbacks and callbacks.on_file_complete:
-                    callbacks.on_file_complete(filename, False, error_msg)
-                results.append(DownloadResult(
-                    success=False,
-                    filename=filename,
-                    error=error_msg
-                ))
-                continue
+        # Notify batch start
+        if callbacks and callbacks.on_batch_start:
+            callbacks.on_batch_start(len(batch))
 
-            # Download new model
-            from ..services.model_downloader import DownloadRequest
+        progress_callback = callbacks.on_file_progress if callbacks else None
+        parallel = max_workers > 1 and len(batch) > 1 and progress_callback is None
 
-            target_path = self.downloader.models_dir / resolved.target_path
+        def download(resolved: ResolvedModel):
             request = DownloadRequest(
                 url=resolved.model_source,
-                target_path=target_path,
+                target_path=self.downloader.models_dir / resolved.target_path,
                 workflow_name=result.workflow_name
             )
-
-            # Use per-file progress callback if provided
-            progress_callback = callbacks.on_file_progress if callbacks else None
-            download_result = self.downloader.download(request, progress_callback=progress_callback)
-
-            if download_result.success and download_result.model:
+            return self.downloader.download(request, progress_callback=progress_callback)
+
+        # Sequential downloads: warm connections to the other hosts while the first file transfers
+        if not parallel:
+            pending_urls = [r.model_source for _, r in batch if r.model_source not in models_by_url]
+            if pending_urls:
+                first_host = urlparse(pending_urls[0]).netloc
+                later_urls = [url for url in pending_urls if urlparse(url).netloc != first_host]
+                if later_urls:
+                    self.downloader.prime_connections(later_urls)
+
+        # BATCHED MODE: hash updates mutate one in-memory config that is saved once,
+        # even if a later download raises, so completed downloads stay recorded
+        config = self.pyproject.load()
+        updated = False
+
+        # Workflow models are loaded once and indexed by widget ref (first match wins);
+        # hash updates mutate them in place and they're written back once
+        workflow_models = self.pyproject.workflows.get_workflow_models(result.workflow_name, config=config)
+        model_by_ref: dict[WorkflowNodeWidgetRef, ManifestWorkflowModel] = {}
+        for workflow_model in workflow_models:
+            for ref in workflow_model.nodes:
+                model_by_ref.setdefault(ref, workflow_model)
+
+        def apply_hash(reference: WorkflowNodeWidgetRef, indexed: ModelWithLocation) -> str | None:
+            """Resolve the referenced workflow model to indexed; returns an error message on failure."""
+            nonlocal updated
+            model = model_by_ref.get(reference)
+            if model is None:
+                return f"Model with reference {reference} not found in workflow '{result.workflow_name}'"
+            try:
+                if self._apply_model_hash(model, indexed.hash, config, indexed):
+                    updated = True
+            except ValueError as e:
+                return str(e)
+            return None
+
+        def finish(
+            pos: int,
+            resolved: ResolvedModel,
+            filename: str,
+            success: bool,
+            model: ModelWithLocation | None,
+            error: str | None,
+            reused: bool
+        ) -> None:
+            """Record a finished intent (main thread only - mutates config).
+
+            A failed pyproject update fails only this file; the rest of the batch continues.
+            """
+            if success and model:
                 # Update pyproject with actual hash
-                self._update_model_hash(
-                    result.workflow_name,
-                    resolved.reference,
-                    download_result.model.hash
-                )
-                # Notify success
-                if callbacks and callbacks.on_file_complete:
-                    callbacks.on_file_complete(filename, True, None)
-            else:
-                # Notify failure (model remains unresolved with source in pyproject)
-                if callbacks and callbacks.on_file_complete:
-                    callbacks.on_file_complete(filename, False, download_result.error)
+                error = apply_hash(resolved.reference, model)
+                if error is None:
+                    models_by_url[resolved.model_source] = model
+                else:
+                    logger.warning(f"Could not record model for '{filename}': {error}")
+                    success = False
+
+            # Notify result (failed models remain unresolved with source in pyproject)
+            if callbacks and callbacks.on_file_complete:
+                callbacks.on_file_complete(filename, success, None if success else error)
 
-            results.append(DownloadResult(
-                success=download_result.success,
+            results[pos] = DownloadResult(
+                success=success,
                 filename=filename,
-                model=download_result.model if download_result.success else None,
-                error=download_result.error if not download_result.success else None
-            ))
+                model=model if success else None,
+                error=None if success else error,
+                reused=reused and success
+            )
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) if parallel else None
+        # URL → download future, so intents sharing a URL wait on one transfer
+        in_flight: dict[str, Future] = {}
+        submitted: list[tuple[int, ResolvedModel, str, Future, bool]] = []
+        try:
+            for idx, (pos, resolved) in enumerate(batch, 1):
+                filename = resolved.reference.widget_value
+
+                # Notify file start
+                if callbacks and callbacks.on_file_start:
+                    callbacks.on_file_start(filename, idx, len(batch))
+
+                # Check if already downloaded (deduplication)
+                existing = models_by_url.get(resolved.model_source)
+                if existing:
+                    # Reuse existing model - update pyproject with hash
+                    finish(pos, resolved, filename, True, existing, None, reused=True)
+                    continue
+
+                # Without a target path, an intent can only share a download already in
+                # flight; reaching here sequentially means that download failed
+                if not resolved.target_path and resolved.model_source not in in_flight:
+                    error_msg = "Download of the shared source failed and intent has no target_path"
+                    finish(pos, resolved, filename, False, None, error_msg, reused=False)
+                    continue
+
+                # Download new model
+                if executor is None:
+                    outcome = download(resolved)
+                    finish(pos, resolved, filename, outcome.success, outcome.model, outcome.error, reused=False)
+                    continue
+
+                future = in_flight.get(resolved.model_source)
+                reused = future is not None
+                if future is None:
+                    future = executor.submit(download, resolved)
+                    in_flight[resolved.model_source] = future
+                submitted.append((pos, resolved, filename, future, reused))
+
+            # Collect concurrent downloads in submission order
+            for pos, resolved, filename, future, reused in submitted:
+                outcome = future.result()
+                finish(pos, resolved, filename, outcome.success, outcome.model, outcome.error, reused)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if updated:
+                self.pyproject.workflows.set_workflow_models(
+                    result.workflow_name, workflow_models, config=config
+                )
+                self.pyproject.save(config)
+                self.workflow_cache.invalidate_resolution(self.environment_name, result.workflow_name)
 
-        # Notify batch complete
+        # Notify batch complete (same population as on_batch_start)
         if callbacks and callbacks.on_batch_complete:
-            success_count = sum(1 for r in results if r.success)
-            callbacks.on_batch_complete(success_count, len(results))
+            success_count = sum(1 for pos, _ in batch if results[pos].success)
+            callbacks.on_batch_complete(success_count, len(batch))
 
         return results
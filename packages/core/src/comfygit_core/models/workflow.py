@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import asdict, dataclass, field
 from functools import cached_property
 from pathlib import Path
@@ -101,6 +102,26 @@ class NodeInstallCallbacks:
     on_batch_complete: Callable[[int, int], None] | None = None
 
 
+class LazyMapping(Mapping[str, Any]):
+    """Read-only mapping whose contents are built by a loader on first access."""
+
+    def __init__(self, loader: Callable[[], dict[str, Any]]):
+        self._loader = loader
+
+    @cached_property
+    def _data(self) -> dict[str, Any]:
+        return self._loader()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 @dataclass
 class ModelResolutionContext:
     """Context for model resolution with search function and workflow info."""
@@ -111,7 +132,8 @@ class ModelResolutionContext:
     previous_resolutions: dict[WorkflowNodeWidgetRef, Any] = field(default_factory=dict)  # TYPE_CHECKING: ManifestWorkflowModel
 
     # Global models table: hash → ManifestGlobalModel (for download intent creation)
-    global_models: dict[str, Any] = field(default_factory=dict)  # TYPE_CHECKING: ManifestGlobalModel
+    # May be a LazyMapping so the table is only read if a strategy consults it
+    global_models: Mapping[str, Any] = field(default_factory=dict)  # TYPE_CHECKING: ManifestGlobalModel
 
     # Search function for fuzzy matching (injected by workflow_manager)
     # Signature: (search_term: str, node_type: str | None, limit: int) -> list[ScoredMatch]
@@ -123,6 +145,12 @@ class ModelResolutionContext:
     # Auto-selection configuration (for automated strategies)
     auto_select_ambiguous: bool = True
 
+    # Lowercased filename / relative path → indexed models, built once per batch
+    # (see ModelResolver.build_model_indexes). When None, the filename and
+    # case-insensitive strategies fall back to a repository query per reference
+    models_by_filename: dict[str, list[ModelWithLocation]] | None = None
+    models_by_path_lower: dict[str, list[ModelWithLocation]] | None = None
+
 
 @dataclass
 class Link:
@@ -652,7 +680,7 @@ class WorkflowNodeWidgetRef:
         """Hash based on core identity fields only for proper dict/set lookups."""
         return hash((self.node_id, self.node_type, self.widget_index, self.widget_value))
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowDependencies:
     """Complete workflow dependency analysis results."""
     workflow_name: str
@@ -1,7 +1,7 @@
 """ModelIndexManager - Model-specific database operations and schema management."""
 
 import json
-from datetime import datetime
+import time
 from pathlib import Path
 
 import xxhash
@@ -208,7 +208,7 @@ class ModelRepository:
 
         self.sqlite.execute_write(
             query,
-            (hash, file_size, blake3_hash, sha256_hash, int(datetime.now().timestamp()))
+            (hash, file_size, blake3_hash, sha256_hash, int(time.time()))
         )
 
         logger.debug(f"Ensured model in index: {hash[:8]}...")
@@ -235,7 +235,7 @@ class ModelRepository:
         normalized_path = relative_path.replace('\\', '/')
         self.sqlite.execute_write(
             query,
-            (model_hash, base_dir_str, normalized_path, filename, mtime, int(datetime.now().timestamp()))
+            (model_hash, base_dir_str, normalized_path, filename, mtime, int(time.time()))
         )
 
         logger.debug(f"Added location: {base_dir_str}/{relative_path} for model {model_hash[:8]}...")
@@ -277,6 +277,31 @@ class ModelRepository:
         query = "SELECT * FROM model_locations WHERE model_hash = ? ORDER BY relative_path"
         return self.sqlite.execute_query(query, (model_hash,))
 
+    def get_locations_for_hashes(self, model_hashes: set[str]) -> dict[str, list[dict]]:
+        """Get all locations for a batch of models in one query.
+
+        Args:
+            model_hashes: Hashes of models to get locations for
+
+        Returns:
+            Dict of model hash -> location dictionaries (ordered by relative path);
+            models with no locations are omitted
+        """
+        if not model_hashes:
+            return {}
+
+        placeholders = ", ".join("?" * len(model_hashes))
+        query = f"""
+        SELECT * FROM model_locations
+        WHERE model_hash IN ({placeholders})
+        ORDER BY relative_path
+        """
+
+        locations_by_hash: dict[str, list[dict]] = {}
+        for row in self.sqlite.execute_query(query, tuple(model_hashes)):
+            locations_by_hash.setdefault(row['model_hash'], []).append(row)
+        return locations_by_hash
+
     def get_all_locations(self, base_directory: Path | None = None) -> list[dict]:
         """Get model locations, optionally filtered by base directory.
 
@@ -504,6 +529,91 @@ class ModelRepository:
 
         return models
 
+    def find_hashes_by_filenames(
+        self, filenames: set[str], base_directory: Path | None = "USE_CURRENT"
+    ) -> dict[str, list[str]]:
+        """Map each filename (case-insensitively) to the hashes of models stored under it.
+
+        One query for a whole batch of filenames, instead of a find_by_filename
+        round-trip per name. Matching ignores (ASCII) case, like the resolver's
+        filename and case-insensitive strategies, so a case-variant model shows up.
+
+        Args:
+            filenames: Filenames to look up
+            base_directory: Directory to filter by. Defaults to current_directory.
+
+        Returns:
+            Dict of lowercased filename -> model hashes (ordered by relative path);
+            filenames with no models are omitted
+        """
+        if not filenames:
+            return {}
+
+        if base_directory == "USE_CURRENT":
+            base_directory = self.current_directory
+
+        lowered = {filename.lower() for filename in filenames}
+        placeholders = ", ".join("?" * len(lowered))
+        query = f"""
+        SELECT filename, model_hash FROM model_locations
+        WHERE lower(filename) IN ({placeholders})
+        """
+        params: tuple = tuple(lowered)
+        if base_directory:
+            query += " AND base_directory = ?"
+            params += (str(base_directory.resolve()),)
+        query += " ORDER BY relative_path"
+
+        hashes_by_filename: dict[str, list[str]] = {}
+        for row in self.sqlite.execute_query(query, params):
+            hashes_by_filename.setdefault(row['filename'].lower(), []).append(row['model_hash'])
+        return hashes_by_filename
+
+    def find_by_source_urls(self, urls: set[str] | list[str]) -> dict[str, ModelWithLocation]:
+        """Map each source URL to a model downloaded from it.
+
+        One query for a whole batch of URLs, instead of a find_by_source_url
+        round-trip per URL.
+
+        Args:
+            urls: Source URLs to look up
+
+        Returns:
+            Dict of source URL -> model; URLs with no known model are omitted
+        """
+        if not urls:
+            return {}
+
+        urls = list(dict.fromkeys(urls))
+        placeholders = ", ".join("?" * len(urls))
+        query = f"""
+        SELECT s.source_url, m.hash, m.file_size, m.blake3_hash, m.sha256_hash, m.metadata,
+               l.base_directory, l.relative_path, l.filename, l.mtime, l.last_seen
+        FROM models m
+        JOIN model_locations l ON m.hash = l.model_hash
+        JOIN model_sources s ON m.hash = s.model_hash
+        WHERE s.source_url IN ({placeholders})
+        """
+
+        models_by_url: dict[str, ModelWithLocation] = {}
+        for row in self.sqlite.execute_query(query, tuple(urls)):
+            if row['source_url'] in models_by_url:
+                continue
+            metadata = json.loads(row['metadata']) if row['metadata'] else {}
+            models_by_url[row['source_url']] = ModelWithLocation(
+                hash=row['hash'],
+                file_size=row['file_size'],
+                blake3_hash=row['blake3_hash'],
+                sha256_hash=row['sha256_hash'],
+                relative_path=row['relative_path'],
+                filename=row['filename'],
+                mtime=row['mtime'],
+                last_seen=row['last_seen'],
+                base_directory=row.get('base_directory'),
+                metadata=metadata
+            )
+        return models_by_url
+
     def get_sources(self, model_hash: str) -> list[dict]:
         """Get all download sources for a model.
 
@@ -555,7 +665,7 @@ class ModelRepository:
 
         self.sqlite.execute_write(
             query,
-            (model_hash, source_type, source_url, json.dumps(metadata), int(datetime.now().timestamp()))
+            (model_hash, source_type, source_url, json.dumps(metadata), int(time.time()))
         )
 
         logger.debug(f"Added source for {model_hash[:8]}...: {source_type} - {source_url}")
@@ -51,7 +51,9 @@ class WorkflowRepository:
         """Save workflow to file."""
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
+            # Serialize in one go: json.dump writes one small chunk per token
+            content = json.dumps(workflow.to_json(), indent=2)
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(workflow.to_json(), f, indent=2)
+                f.write(content)
         except (OSError, UnicodeEncodeError) as e:
             raise ValueError(f"Failed to save workflow {path}: {e}") from e
@@ -1,6 +1,7 @@
 """ModelResolver - Resolve model requirements for environment import/export."""
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -23,6 +24,11 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _widget_filename(widget_value: str) -> str:
+    """Filename part of a widget path, accepting either separator (cheaper than Path().name)."""
+    return widget_value.replace('\\', '/').rpartition('/')[2]
+
+
 class ModelResolver:
     """Resolve model requirements for environments using multiple strategies."""
 
@@ -39,126 +45,65 @@ class ModelResolver:
             download_manager: Optional ModelDownloadManager for downloading
         """
         self.model_repository = model_repository
-        self.model_config = model_config or ModelConfig.load()
+        if model_config is not None:
+            self.model_config = model_config
         self.download_manager = download_manager
+        self._reconstructed_paths_cache: dict[tuple[str, str], list[str]] = {}
+
+    @cached_property
+    def model_config(self) -> ModelConfig:
+        """Default model config, loaded on first use when none was injected."""
+        return ModelConfig.load()
 
     def resolve_model(
         self, ref: WorkflowNodeWidgetRef, model_context: ModelResolutionContext
     ) -> list[ResolvedModel] | None:
         """Try multiple resolution strategies"""
         workflow_name = model_context.workflow_name
-        widget_value = ref.widget_value
 
         # Strategy 0: Check existing pyproject model data first
         context_resolution_result = self._try_context_resolution(widget_ref=ref, context=model_context)
         if context_resolution_result:
             logger.debug(
-                f"Resolved {ref} to {context_resolution_result.resolved_model} from pyproject.toml"
+                "Resolved %s to %s from pyproject.toml", ref, context_resolution_result.resolved_model
             )
             return [context_resolution_result]
 
-        # Strategy 1: Exact path match
-        all_models = self.model_repository.get_all_models()
-        candidates = self._try_exact_match(widget_value, all_models)
-        if len(candidates) == 1:
-            logger.debug(f"Resolved {ref} to {candidates[0]} as exact match")
-            return [
-                ResolvedModel(
-                    workflow=workflow_name,
-                    reference=ref,
-                    match_type="exact",
-                    resolved_model=candidates[0],
-                    match_confidence=1.0,
-                )
-            ]
-
-        # Strategy 2: Reconstruct paths for native loaders
-        if self.model_config.is_model_loader_node(ref.node_type):
-            paths = self.model_config.reconstruct_model_path(
-                ref.node_type, widget_value
-            )
-            for path in paths:
-                candidates = self._try_exact_match(path, all_models)
-                if len(candidates) == 1:
-                    logger.debug(
-                        f"Resolved {ref} to {candidates[0]} as reconstructed match"
+        # Strategies 1-4: Match against the model index, in CANDIDATE_STRATEGIES order
+        for match_type, confidence, allow_ambiguous, find_candidates in self.CANDIDATE_STRATEGIES:
+            candidates = find_candidates(self, ref, model_context)
+            if len(candidates) == 1:
+                logger.debug("Resolved %s to %s as %s match", ref, candidates[0], match_type)
+                return [
+                    ResolvedModel(
+                        workflow=workflow_name,
+                        reference=ref,
+                        match_type=match_type,
+                        resolved_model=candidates[0],
+                        match_confidence=confidence,
                     )
-                    return [
-                        ResolvedModel(
-                            workflow=workflow_name,
-                            reference=ref,
-                            match_type="reconstructed",
-                            resolved_model=candidates[0],
-                            match_confidence=0.9,
-                        )
-                    ]
-
-        # Strategy 3: Case-insensitive match
-        candidates = self._try_case_insensitive_match(widget_value, all_models)
-        if len(candidates) == 1:
-            logger.debug(f"Resolved {ref} to {candidates[0]} as case-insensitive match")
-            return [
-                ResolvedModel(
-                    workflow=workflow_name,
-                    reference=ref,
-                    match_type="case_insensitive",
-                    resolved_model=candidates[0],
-                    match_confidence=0.8,
-                )
-            ]
-        elif len(candidates) > 1:
-            # Multiple matches - need disambiguation
-            logger.debug(
-                f"Resolved {ref} to {candidates} as case-insensitive match, ambiguous"
-            )
-            return [
-                ResolvedModel(
-                    workflow=workflow_name,
-                    reference=ref,
-                    match_type="case_insensitive",
-                    resolved_model=model,
-                    match_confidence=0.0,
-                )
-                for model in candidates
-            ]
-
-        # Strategy 4: Filename-only match
-        filename = Path(widget_value).name
-        candidates = self.model_repository.find_by_filename(filename)
-        if len(candidates) == 1:
-            logger.debug(f"Resolved {ref} to {candidates[0]} as filename-only match")
-            return [
-                ResolvedModel(
-                    workflow=workflow_name,
-                    reference=ref,
-                    match_type="filename",
-                    resolved_model=candidates[0],
-                    match_confidence=0.7,
-                )
-            ]
-        elif len(candidates) > 1:
-            # Multiple matches - need disambiguation
-            logger.debug(
-                f"Resolved {ref} to {candidates} as filename-only match, ambiguous"
-            )
-            return [
-                ResolvedModel(
-                    workflow=workflow_name,
-                    reference=ref,
-                    match_type="filename",
-                    resolved_model=model,
-                    match_confidence=0.0,
-                )
-                for model in candidates
-            ]
+                ]
+            if len(candidates) > 1 and allow_ambiguous:
+                # Multiple matches - need disambiguation
+                logger.debug("Resolved %s to %s as %s match, ambiguous", ref, candidates, match_type)
+                return [
+                    ResolvedModel(
+                        workflow=workflow_name,
+                        reference=ref,
+                        match_type=match_type,
+                        resolved_model=model,
+                        match_confidence=0.0,
+                    )
+                    for model in candidates
+                ]
 
         # Strategy 5: Auto-create download intent from properties.models metadata
         if ref.property_url:
             target_directory = ref.property_directory or self._infer_directory_for_node(ref.node_type)
-            target_path = Path(target_directory) / Path(ref.widget_value).name
+            target_path = Path(target_directory) / _widget_filename(ref.widget_value)
             logger.debug(
-                f"Creating property-based download intent for {ref.widget_value} "
-                f"from URL: {ref.property_url} -> {target_path}"
+                "Creating property-based download intent for %s from URL: %s -> %s",
+                ref.widget_value, ref.property_url, target_path
             )
             return [
                 ResolvedModel(
@@ -173,9 +118,79 @@ class ModelResolver:
             ]
 
         # No matches found
-        logger.debug(f"No matches found in pyproject or model index for {ref}")
+        logger.debug("No matches found in pyproject or model index for %s", ref)
         return None
 
+    def _exact_candidates(
+        self, ref: WorkflowNodeWidgetRef, model_context: ModelResolutionContext
+    ) -> list[ModelWithLocation]:
+        """Strategy 1: Exact path match"""
+        return self.find_exact(ref.widget_value, model_context)
+
+    def _reconstructed_candidates(
+        self, ref: WorkflowNodeWidgetRef, model_context: ModelResolutionContext
+    ) -> list[ModelWithLocation]:
+        """Strategy 2: Reconstruct paths for native loaders, first unique hit wins"""
+        if not self.model_config.is_model_loader_node(ref.node_type):
+            return []
+        for path in self.reconstruct_model_path(ref.node_type, ref.widget_value):
+            if candidates := self.find_exact(path, model_context):
+                return candidates
+        return []
+
+    def _case_insensitive_candidates(
+        self, ref: WorkflowNodeWidgetRef, model_context: ModelResolutionContext
+    ) -> list[ModelWithLocation]:
+        """Strategy 3: Case-insensitive match"""
+        if model_context.models_by_path_lower is not None:
+            return model_context.models_by_path_lower.get(ref.widget_value.lower(), [])
+        return self._try_case_insensitive_match(ref.widget_value)
+
+    def _filename_candidates(
+        self, ref: WorkflowNodeWidgetRef, model_context: ModelResolutionContext
+    ) -> list[ModelWithLocation]:
+        """Strategy 4: Filename-only match"""
+        filename = _widget_filename(ref.widget_value)
+        if model_context.models_by_filename is not None:
+            return model_context.models_by_filename.get(filename.lower(), [])
+        return self.model_repository.find_by_filename(filename)
+
+    def build_model_indexes(
+        self,
+    ) -> tuple[dict[str, list[ModelWithLocation]], dict[str, list[ModelWithLocation]]]:
+        """Group indexed models by lowercased filename and by lowercased relative path.
+
+        Returns the (models_by_filename, models_by_path_lower) pair for
+        ModelResolutionContext. Built in one pass over the index per batch so the
+        filename and case-insensitive strategies are dict lookups instead of a
+        repository query (or full model scan) per reference.
+        """
+        by_filename: dict[str, list[ModelWithLocation]] = {}
+        by_path_lower: dict[str, list[ModelWithLocation]] = {}
+        for model in self.model_repository.get_all_models():
+            by_filename.setdefault(model.filename.lower(), []).append(model)
+            by_path_lower.setdefault(model.relative_path.lower(), []).append(model)
+        return by_filename, by_path_lower
+
+    # Ordered (match_type, confidence, allow_ambiguous, candidate finder) table.
+    # A unique candidate resolves; ambiguous candidates either fall through to the
+    # next strategy or, when allowed, are returned for disambiguation.
+    CANDIDATE_STRATEGIES = (
+        ("exact", 1.0, False, _exact_candidates),
+        ("reconstructed", 0.9, False, _reconstructed_candidates),
+        ("case_insensitive", 0.8, True, _case_insensitive_candidates),
+        ("filename", 0.7, True, _filename_candidates),
+    )
+
+    def reconstruct_model_path(self, node_type: str, widget_value: str) -> list[str]:
+        """Memoized ModelConfig.reconstruct_model_path - workflows repeat the same loader refs."""
+        key = (node_type, widget_value)
+        paths = self._reconstructed_paths_cache.get(key)
+        if paths is None:
+            paths = self.model_config.reconstruct_model_path(node_type, widget_value)
+            self._reconstructed_paths_cache[key] = paths
+        return paths
+
     def _infer_directory_for_node(self, node_type: str) -> str:
         """Infer target model directory from node type.
 
@@ -187,11 +202,31 @@ class ModelResolver:
             return directories[0]  # Use first directory as default
         return "models"
 
-    def _try_exact_match(self, path: str, all_models: list[ModelWithLocation] | None =None) -> list["ModelWithLocation"]:
-        """Try exact path match"""
-        if all_models is None:
-            all_models = self.model_repository.get_all_models()
-        return [m for m in all_models if m.relative_path == path]
+    def find_exact(
+        self, path: str, model_context: ModelResolutionContext | None = None
+    ) -> list[ModelWithLocation]:
+        """Exact path match, served from the context's batch index when available.
+
+        The lowercased-path index holds every indexed model, so an exact match is
+        the case-sensitive subset of its bucket; otherwise query the repository.
+        """
+        index = model_context.models_by_path_lower if model_context else None
+        if index is None:
+            return self._try_exact_match(path)
+        path = path.replace('\\', '/')
+        for model in index.get(path.lower(), ()):
+            if model.relative_path == path:
+                return [model]
+        return []
+
+    def _try_exact_match(self, path: str) -> list["ModelWithLocation"]:
+        """Try exact path match.
+
+        Uses the repository's indexed path lookup; relative paths are unique per
+        models directory, so there is at most one match.
+        """
+        model = self.model_repository.find_by_exact_path(path)
+        return [model] if model else []
 
     def _try_case_insensitive_match(self, path: str, all_models: list[ModelWithLocation] | None =None) -> list["ModelWithLocation"]:
         """Try case-insensitive path match"""
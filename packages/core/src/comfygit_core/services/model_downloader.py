@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -80,6 +81,38 @@ class ModelDownloader:
 
         self.model_config = ModelConfig.load()
 
+        # Shared by all downloads so repeat hosts reuse pooled connections. Created
+        # eagerly: prime_connections uses it from worker threads.
+        self.session = requests.Session()
+
+    def prime_connections(self, urls: list[str]) -> None:
+        """Open pooled connections to each URL's host in the background.
+
+        Later downloads from those hosts skip the TCP/TLS handshake. Best-effort:
+        returns immediately, and failures are only logged.
+
+        Args:
+            urls: URLs whose hosts will be downloaded from soon
+        """
+        origins = list(dict.fromkeys(
+            f"{parsed.scheme}://{parsed.netloc}/"
+            for parsed in map(urlparse, urls)
+            if parsed.scheme in ("http", "https") and parsed.netloc
+        ))
+        if not origins:
+            return
+
+        def head(origin: str) -> None:
+            try:
+                self.session.head(origin, timeout=(5, 5)).close()
+            except requests.RequestException as e:
+                logger.debug(f"Could not prime connection to {origin}: {e}")
+
+        executor = ThreadPoolExecutor(max_workers=min(4, len(origins)))
+        for origin in origins:
+            executor.submit(head, origin)
+        executor.shutdown(wait=False)
+
     def detect_url_type(self, url: str) -> str:
         """Detect source type from URL.
 
@@ -267,6 +300,7 @@ class ModelDownloader:
             DownloadResult with model or error
         """
         temp_path: Path | None = None
+        response: requests.Response | None = None
         try:
             # Step 1: Check if already downloaded
             existing = self.repository.find_by_source_url(request.url)
@@ -290,7 +324,7 @@ class ModelDownloader:
 
             # Timeout: (connect_timeout, read_timeout)
             # 30s to establish connection, None for read (allow slow downloads)
-            response = requests.get(request.url, stream=True, timeout=(30, None), headers=headers)
+            response = self.session.get(request.url, stream=True, timeout=(30, None), headers=headers)
             response.raise_for_status()
 
             # Extract total size from headers (may be None)
@@ -413,6 +447,10 @@ class ModelDownloader:
             )
 
         finally:
+            # Release the connection back to the session pool
+            if response is not None:
+                response.close()
+
             # Always clean up temp file if it still exists (download failed or was interrupted)
             if temp_path is not None and temp_path.exists():
                 try:
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -66,6 +70,11 @@ class NodeLookupService:
     - Cache management (API responses, downloaded node archives)
     """
 
+    # How long find_node results are reused before hitting the network again
+    FIND_CACHE_TTL_SECONDS = 300
+    # Most identifiers whose find_node results are kept at once
+    FIND_CACHE_MAX_ENTRIES = 256
+
     def __init__(
         self,
         cache_path: Path,
@@ -82,10 +91,20 @@ class NodeLookupService:
         self.registry_client = ComfyRegistryClient()
         self.github_client = GitHubClient()
         self.node_mappings_repository = node_mappings_repository
+        self._find_cache: dict[str, tuple[float, NodeInfo]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop memoized find_node results so the next lookup hits the network."""
+        self._find_cache.clear()
 
     def find_node(self, identifier: str) -> NodeInfo | None:
         """Find node info from registry API, git URL, or local cache.
 
+        Found nodes are memoized per identifier for FIND_CACHE_TTL_SECONDS, so repeated
+        lookups of the same node during dependency expansion cost one round-trip.
+        Misses are not memoized since they are often transient network failures.
+        Callers get their own copy since NodeInfo is mutated during installation.
+
         API-first strategy:
         1. Git URLs → query GitHub API directly
         2. Registry IDs → query live registry API first
@@ -101,14 +120,35 @@ class NodeLookupService:
         Returns:
             NodeInfo with metadata, or None if not found
         """
+        cached = self._find_cache.get(identifier)
+        if cached is not None and time.monotonic() - cached[0] < self.FIND_CACHE_TTL_SECONDS:
+            node_info = cached[1]
+        else:
+            node_info = self._find_node_uncached(identifier)
+            if node_info is not None:
+                self._remember_found_node(identifier, node_info)
+        return replace(node_info) if node_info else None
+
+    def _remember_found_node(self, identifier: str, node_info: NodeInfo) -> None:
+        """Memoize a find_node result, pruning expired and overflow entries."""
+        now = time.monotonic()
+        self._find_cache.pop(identifier, None)
+        # Entries stay in insertion order, so the oldest (and any expired) come first
+        while self._find_cache:
+            oldest, (stored_at, _) = next(iter(self._find_cache.items()))
+            expired = now - stored_at >= self.FIND_CACHE_TTL_SECONDS
+            if not expired and len(self._find_cache) < self.FIND_CACHE_MAX_ENTRIES:
+                break
+            del self._find_cache[oldest]
+        self._find_cache[identifier] = (now, node_info)
+
+    def _find_node_uncached(self, identifier: str) -> NodeInfo | None:
+        """Resolve an identifier against GitHub, the registry API, or local mappings."""
         # Parse version/ref from identifier (e.g., "package-id@1.2.3" or "https://...@branch")
-        requested_version = None
-        base_identifier = identifier
-
-        if '@' in identifier:
-            parts = identifier.rsplit('@', 1)  # rsplit to handle URLs with @
-            base_identifier = parts[0]
-            requested_version = parts[1]
+        # rpartition splits on the last @ to handle URLs containing @
+        base_identifier, sep, requested_version = identifier.rpartition('@')
+        if not sep:
+            base_identifier, requested_version = identifier, None
 
         # Check if it's a git URL - these go directly to GitHub API
         if is_git_url(base_identifier):
@@ -128,14 +168,18 @@ class NodeLookupService:
         try:
             registry_node = self.registry_client.get_node(base_identifier)
             if registry_node:
-                if requested_version:
-                    version = requested_version
-                    logger.debug(f"Using requested version: {version}")
-                else:
-                    version = registry_node.latest_version.version if registry_node.latest_version else None
-                node_version = self.registry_client.install_node(registry_node.id, version)
-                if node_version:
-                    registry_node.latest_version = node_version
+                latest = registry_node.latest_version
+                # The node payload already carries latest download info; only ask the
+                # install endpoint for a specific version or when the URL is missing
+                if requested_version or not (latest and latest.download_url):
+                    if requested_version:
+                        version = requested_version
+                        logger.debug(f"Using requested version: {version}")
+                    else:
+                        version = latest.version if latest else None
+                    node_version = self.registry_client.install_node(registry_node.id, version)
+                    if node_version:
+                        registry_node.latest_version = node_version
                 return NodeInfo.from_registry_node(registry_node)
         except CDRegistryError as e:
             logger.warning(f"Cannot reach registry: {e}")
@@ -204,8 +248,6 @@ class NodeLookupService:
         Returns:
             Path to cached node directory, or None if download failed
         """
-        import tempfile
-
         from ..utils.download import download_and_extract_archive
         from ..utils.git import git_clone
 
@@ -214,10 +256,8 @@ class NodeLookupService:
             logger.debug(f"Node '{node_info.name}' already in cache")
             return cache_path
 
-        # Download to temp location
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_path = Path(tmpdir) / node_info.name
-
+        # Download to a staging location on the cache filesystem
+        with self.custom_node_cache.acquire_staging_path(node_info) as temp_path:
             try:
                 if node_info.source == "registry":
                     if not node_info.download_url:
@@ -258,12 +298,44 @@ class NodeLookupService:
 
                 # Cache it
                 logger.info(f"Caching node '{node_info.name}'")
-                return self.custom_node_cache.cache_node(node_info, temp_path)
+                return self.custom_node_cache.cache_node(node_info, temp_path, move=True)
 
             except Exception as e:
                 logger.error(f"Failed to download node '{node_info.name}': {e}")
                 return None
 
+    def download_many_to_cache(
+        self, node_infos: list[NodeInfo], max_workers: int = 8
+    ) -> Iterator[tuple[NodeInfo, Path | None, str | None]]:
+        """Download several nodes to cache concurrently.
+
+        Downloads are network/git bound, so a thread pool overlaps their latency.
+        Results are yielded as each download finishes, so callers can report
+        progress while the rest are still in flight.
+
+        Args:
+            node_infos: Nodes to download
+            max_workers: Maximum concurrent downloads
+
+        Yields:
+            (node_info, cached_path, error) in completion order; cached_path is
+            None and error describes the failure when a download fails
+        """
+        if not node_infos:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(node_infos))) as executor:
+            futures = {executor.submit(self.download_to_cache, node_info): node_info for node_info in node_infos}
+            for future in as_completed(futures):
+                node_info = futures[future]
+                try:
+                    cache_path = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to download node '{node_info.name}': {e}")
+                    yield node_info, None, str(e)
+                    continue
+                yield node_info, cache_path, None if cache_path else "Download failed"
+
     def search_nodes(self, query: str, limit: int = 10) -> list[NodeInfo] | None:
         """Search for nodes in the registry.
 
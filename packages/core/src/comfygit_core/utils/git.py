@@ -13,6 +13,10 @@ from .common import run_command
 
 logger = get_logger(__name__)
 
+# URL prefixes recognized by is_git_url / is_github_url
+_GIT_URL_PREFIXES = ('https://', 'http://', 'git@', 'ssh://')
+_GITHUB_URL_PREFIXES = ('https://github.com/', 'git@github.com:', 'ssh://git@github.com/')
+
 
 # =============================================================================
 # Error Handling Utilities
@@ -118,7 +122,7 @@ def is_git_url(url: str) -> bool:
     Returns:
         True if URL appears to be a git repository URL
     """
-    return url.startswith(('https://', 'http://', 'git@', 'ssh://'))
+    return url.startswith(_GIT_URL_PREFIXES)
 
 def is_github_url(url: str) -> bool:
     """Check if string is specifically a GitHub URL.
@@ -129,7 +133,7 @@ def is_github_url(url: str) -> bool:
     Returns:
         True if URL is a GitHub repository URL
     """
-    return url.startswith(('https://github.com/', 'git@github.com:', 'ssh://git@github.com/'))
+    return url.startswith(_GITHUB_URL_PREFIXES)
 
 def normalize_github_url(url: str) -> str:
     """Normalize GitHub URL to canonical https://github.com/owner/repo format.
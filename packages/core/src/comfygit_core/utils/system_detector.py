@@ -2,13 +2,76 @@
 import json
 import platform
 import re
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from ..logging.logging_config import get_logger
-from ..models.shared import SystemInfo
+from ..models.system import SystemInfo
 from .common import run_command
 
+_CUDA_VERSION_RE = re.compile(rb'CUDA Version:\s*(\d+\.\d+)')
+# "CUDA Version" sits in nvidia-smi's header banner, well inside this window
+_CUDA_HEADER_BYTES = 512
+
+
+def _query_cuda_version_nvml() -> str | None:
+    """Ask NVML for the driver's CUDA version, if pynvml is installed.
+
+    NVML calls are in-process and much cheaper than spawning nvidia-smi.
+    Returns None when pynvml is unavailable or NVML can't initialize.
+    """
+    try:
+        import pynvml
+    except ImportError:
+        return None
+
+    try:
+        pynvml.nvmlInit()
+        try:
+            version = pynvml.nvmlSystemGetCudaDriverVersion_v2()
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception as e:
+        get_logger(__name__).debug(f"NVML CUDA query failed: {e}")
+        return None
+
+    # NVML encodes e.g. 12.8 as 12080
+    return f"{version // 1000}.{(version % 1000) // 10}"
+
+
+@lru_cache(maxsize=1)
+def _query_cuda_version() -> str | None:
+    """Query the driver's CUDA version once per process - it can't change underneath us.
+
+    Prefers NVML (pynvml) and falls back to parsing nvidia-smi output.
+    Failures (no driver, no GPU) are cached as None too, so CPU-only machines
+    don't pay for a failed subprocess on every detection.
+    """
+    cuda_version = _query_cuda_version_nvml()
+    if cuda_version:
+        return cuda_version
+
+    # No driver tools on PATH (CPU-only machines) - skip spawning a process at all
+    if shutil.which('nvidia-smi') is None:
+        return None
+
+    try:
+        result = run_command(['nvidia-smi'], timeout=5, text=False)
+        if result.returncode == 0:
+            # Parse CUDA version from the header, then the full output as a fallback
+            stdout = result.stdout
+            match = (
+                _CUDA_VERSION_RE.search(stdout, 0, _CUDA_HEADER_BYTES)
+                or _CUDA_VERSION_RE.search(stdout)
+            )
+            if match:
+                return match.group(1).decode()
+    except Exception as e:
+        get_logger(__name__).debug(f"Could not detect CUDA: {e}")
+    return None
+
 
 class SystemDetector:
     """Detects system-level dependencies like Python, CUDA, and PyTorch."""
@@ -191,17 +254,10 @@ class SystemDetector:
 
     def _detect_cuda_version(self) -> str | None:
         """Detect CUDA version using nvidia-smi."""
-        try:
-            result = run_command(['nvidia-smi'])
-            if result.returncode == 0:
-                # Parse CUDA version from nvidia-smi output
-                match = re.search(r'CUDA Version:\s*(\d+\.\d+)', result.stdout)
-                if match:
-                    cuda_version = match.group(1)
-                    self.logger.info(f"CUDA version: {cuda_version}")
-                    return cuda_version
-        except Exception as e:
-            self.logger.debug(f"Could not detect CUDA: {e}")
+        cuda_version = _query_cuda_version()
+        if cuda_version:
+            self.logger.info(f"CUDA version: {cuda_version}")
+            return cuda_version
 
         self.logger.info("No CUDA detected (CPU-only mode)")
         return None
@@ -432,6 +432,32 @@ class TestInvalidation:
         assert result_env2_wf1.dependencies is not None  # has data
 
 
+class TestResolutionInvalidation:
+    """Test dropping a cached resolution while keeping dependency analysis."""
+
+    def test_invalidate_resolution_keeps_dependencies(
+        self,
+        cache_db,
+        sample_workflow_file,
+        sample_dependencies
+    ):
+        """Session entry should need re-resolution but still carry dependencies."""
+        from comfygit_core.models.workflow import ResolutionResult
+
+        cache_db.set(
+            "env1", "test_workflow", sample_workflow_file, sample_dependencies,
+            resolution=ResolutionResult(workflow_name="test_workflow")
+        )
+        assert cache_db.get("env1", "test_workflow", sample_workflow_file).resolution is not None
+
+        cache_db.invalidate_resolution("env1", "test_workflow")
+
+        cached = cache_db.get("env1", "test_workflow", sample_workflow_file)
+        assert cached.needs_reresolution
+        assert cached.resolution is None
+        assert cached.dependencies.workflow_name == sample_dependencies.workflow_name
+
+
 class TestSessionCacheInvalidationOnFileChange:
     """Test that session cache automatically invalidates when workflow file changes.
 
@@ -69,7 +69,7 @@ def mock_pyproject_manager():
 def mock_model_repository():
     """Create mock model repository."""
     repo = Mock()
-    repo.find_by_filename.return_value = []
+    repo.find_hashes_by_filenames.return_value = {}
     return repo
 
 
@@ -308,3 +308,41 @@ class TestContextHashCustomMappings:
 
         # Hash should change
         assert hash2 != hash1
+
+
+class TestContextHashModelIndex:
+    """Test that model index changes relevant to resolution are captured."""
+
+    def test_case_variant_model_invalidates_context_hash(self, tmp_path, mock_pyproject_manager):
+        """Indexing a case variant of a referenced filename should change the hash."""
+        import time
+
+        from comfygit_core.repositories.model_repository import ModelRepository
+
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        repository = ModelRepository(tmp_path / "models.db", current_directory=models_dir)
+        cache = WorkflowCacheRepository(
+            db_path=tmp_path / "test_cache.db",
+            pyproject_manager=mock_pyproject_manager,
+            model_repository=repository
+        )
+        dependencies = WorkflowDependencies(
+            workflow_name="workflow_a",
+            found_models=[WorkflowNodeWidgetRef(
+                node_id="1", node_type="CheckpointLoaderSimple",
+                widget_index=0, widget_value="sd15.safetensors"
+            )]
+        )
+
+        hash1 = cache._compute_resolution_context_hash(dependencies, "workflow_a")
+
+        # The resolver matches filenames case-insensitively, so this changes resolution
+        repository.ensure_model("hash_a", 1000, blake3_hash="hash_a")
+        repository.add_location(
+            "hash_a", models_dir, "checkpoints/SD15.safetensors", "SD15.safetensors", time.time()
+        )
+
+        hash2 = cache._compute_resolution_context_hash(dependencies, "workflow_a")
+
+        assert hash2 != hash1
@@ -209,6 +209,63 @@ class TestPropertiesModelsExtraction:
         t5_ref = refs_by_value["t5xxl.safetensors"]
         assert t5_ref.property_url is None
 
+    def test_properties_models_with_dict_widgets_values(self, tmp_path):
+        """Nodes storing widgets_values as a dict should fall back to the entry index."""
+        nodes = [{
+            "id": 1,
+            "type": "VHS_LoadVideo",
+            "widgets_values": {"video": "clip.mp4", "model": "upscaler.pth"},
+            "properties": {
+                "models": [
+                    {"name": "upscaler.pth", "directory": "upscale_models"}
+                ]
+            }
+        }]
+        wf_path = self._create_workflow_file(tmp_path, nodes)
+
+        parser = WorkflowDependencyParser(wf_path)
+        deps = parser.analyze_dependencies()
+
+        refs_by_value = {m.widget_value: m for m in deps.found_models}
+        ref = refs_by_value["upscaler.pth"]
+        assert ref.widget_index == 0
+        assert ref.property_directory == "upscale_models"
+
+
+class TestWorkflowLoadCache:
+    """Tests for reusing parsed workflows across parser instances."""
+
+    def test_reuses_parsed_workflow_until_file_changes(self, tmp_path):
+        """Unchanged files share one parse; rewriting the file invalidates it."""
+        wf_path = tmp_path / "cached.json"
+        wf_path.write_text(json.dumps({"nodes": [], "links": []}))
+
+        first = WorkflowDependencyParser(wf_path)
+        second = WorkflowDependencyParser(wf_path)
+        assert first.workflow is second.workflow
+
+        wf_path.write_text(json.dumps({"nodes": [{"id": 1, "type": "KSampler"}], "links": []}))
+        third = WorkflowDependencyParser(wf_path)
+        assert third.workflow is not first.workflow
+        assert len(third.workflow.nodes) == 1
+
+
+    def test_node_classifier_follows_builtins_file(self, tmp_path):
+        """Shared classifier is rebuilt when the environment's builtins change."""
+        cec_path = tmp_path / ".cec"
+        cec_path.mkdir()
+        builtins_file = cec_path / "comfyui_builtins.json"
+        builtins_file.write_text(json.dumps({"all_builtin_nodes": ["MyNode"]}))
+        wf_path = tmp_path / "wf.json"
+        wf_path.write_text(json.dumps({"nodes": [{"id": 1, "type": "MyNode"}], "links": []}))
+
+        deps = WorkflowDependencyParser(wf_path, cec_path=cec_path).analyze_dependencies()
+        assert [n.type for n in deps.builtin_nodes] == ["MyNode"]
+
+        builtins_file.write_text(json.dumps({"all_builtin_nodes": ["OtherNode"]}))
+        deps = WorkflowDependencyParser(wf_path, cec_path=cec_path).analyze_dependencies()
+        assert [n.type for n in deps.non_builtin_nodes] == ["MyNode"]
+
 
 class TestWorkflowNodeWidgetRefEquality:
     """Tests for WorkflowNodeWidgetRef hash/eq behavior with optional metadata."""
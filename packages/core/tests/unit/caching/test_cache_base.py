@@ -186,6 +186,25 @@ class TestContentCacheBase:
             # Should have new content
             assert (cached_path / "file.txt").read_text() == "version2"
 
+    def test_cache_content_move_relocates_source(self):
+        """SHOULD move source into the store instead of copying when move=True."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ContentCacheBase(
+                content_type="test_content",
+                cache_base_path=Path(tmpdir)
+            )
+
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "file.txt").write_text("test")
+
+            cached_path = cache.cache_content(
+                cache_key="test_key", source_path=source_dir, move=True
+            )
+
+            assert (cached_path / "file.txt").read_text() == "test"
+            assert not source_dir.exists()
+
     def test_get_cached_path_returns_none_when_missing(self):
         """SHOULD return None when cache key doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
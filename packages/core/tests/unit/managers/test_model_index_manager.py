@@ -193,3 +193,71 @@ def test_workflow_search_with_path_separators(tmp_path):
     search_results = index_mgr.search("v1-5")
     assert len(search_results) >= 1
     assert any("v1-5" in m.filename for m in search_results)
+
+
+def test_find_hashes_by_filenames(tmp_path):
+    """Test batch filename lookup returns exact-name matches in one query."""
+    db_path = tmp_path / "test_batch.db"
+    base_path = tmp_path / "models"
+    base_path.mkdir()
+    index_mgr = ModelRepository(db_path, current_directory=base_path)
+
+    index_mgr.ensure_model("hash_a", 1000, blake3_hash="hash_a")
+    index_mgr.ensure_model("hash_b", 2000, blake3_hash="hash_b")
+    index_mgr.ensure_model("hash_c", 3000, blake3_hash="hash_c")
+    index_mgr.add_location("hash_a", base_path, "checkpoints/model.safetensors", "model.safetensors", time.time())
+    index_mgr.add_location("hash_b", base_path, "loras/model.safetensors", "model.safetensors", time.time())
+    index_mgr.add_location("hash_c", base_path, "loras/my_model.safetensors", "my_model.safetensors", time.time())
+
+    index_mgr.ensure_model("hash_d", 4000, blake3_hash="hash_d")
+    index_mgr.add_location("hash_d", base_path, "vae/Model.safetensors", "Model.safetensors", time.time())
+
+    result = index_mgr.find_hashes_by_filenames({"model.safetensors", "missing.safetensors"})
+
+    # Case variants match too, under the lowercased filename
+    assert result == {"model.safetensors": ["hash_a", "hash_b", "hash_d"]}
+    assert index_mgr.find_hashes_by_filenames(set()) == {}
+
+
+def test_find_by_source_urls(tmp_path):
+    """Test batch source URL lookup maps each known URL to its model."""
+    db_path = tmp_path / "test_sources.db"
+    base_path = tmp_path / "models"
+    base_path.mkdir()
+    index_mgr = ModelRepository(db_path, current_directory=base_path)
+
+    index_mgr.ensure_model("hash_a", 1000, blake3_hash="hash_a")
+    index_mgr.ensure_model("hash_b", 2000, blake3_hash="hash_b")
+    index_mgr.add_location("hash_a", base_path, "checkpoints/a.safetensors", "a.safetensors", time.time())
+    index_mgr.add_location("hash_b", base_path, "loras/b.safetensors", "b.safetensors", time.time())
+    index_mgr.add_source("hash_a", "custom", "https://example.com/a")
+    index_mgr.add_source("hash_b", "custom", "https://example.com/b")
+
+    result = index_mgr.find_by_source_urls(["https://example.com/a", "https://example.com/missing"])
+
+    assert set(result) == {"https://example.com/a"}
+    assert result["https://example.com/a"].hash == "hash_a"
+    assert result["https://example.com/a"].relative_path == "checkpoints/a.safetensors"
+    assert index_mgr.find_by_source_urls(set()) == {}
+
+
+def test_get_locations_for_hashes(tmp_path):
+    """Test batch location lookup groups every location under its model hash."""
+    db_path = tmp_path / "test_locations.db"
+    base_path = tmp_path / "models"
+    base_path.mkdir()
+    index_mgr = ModelRepository(db_path, current_directory=base_path)
+
+    index_mgr.ensure_model("hash_a", 1000, blake3_hash="hash_a")
+    index_mgr.ensure_model("hash_b", 2000, blake3_hash="hash_b")
+    index_mgr.add_location("hash_a", base_path, "loras/a.safetensors", "a.safetensors", time.time())
+    index_mgr.add_location("hash_a", base_path, "checkpoints/a.safetensors", "a.safetensors", time.time())
+    index_mgr.add_location("hash_b", base_path, "vae/b.safetensors", "b.safetensors", time.time())
+
+    result = index_mgr.get_locations_for_hashes({"hash_a", "missing"})
+
+    assert set(result) == {"hash_a"}
+    assert [loc['relative_path'] for loc in result["hash_a"]] == [
+        "checkpoints/a.safetensors", "loras/a.safetensors"
+    ]
+    assert index_mgr.get_locations_for_hashes(set()) == {}
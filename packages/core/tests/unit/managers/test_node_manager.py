@@ -7,6 +7,7 @@ import shutil
 
 from comfygit_core.managers.node_manager import NodeManager
 from comfygit_core.models.shared import NodeInfo
+from comfygit_core.models.workflow import NodeInstallCallbacks
 from comfygit_core.utils.git import is_github_url
 
 
@@ -120,4 +121,47 @@ class TestNodeManager:
 
         # Verify .disabled was removed
         assert not disabled_dir.exists()
-        assert not (custom_nodes_dir / "test-node.disabled").exists()
\ No newline at end of file
+        assert not (custom_nodes_dir / "test-node.disabled").exists()
+
+    def test_sync_nodes_reports_each_download_as_it_completes(self, tmp_path):
+        """Test that sync reports per-node progress and propagates download errors."""
+        custom_nodes_dir = tmp_path / "custom_nodes"
+        cache_dir = tmp_path / "cache" / "good-node"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "node.py").write_text("node content")
+
+        good = NodeInfo(name="good-node", source="registry")
+        bad = NodeInfo(name="bad-node", source="registry")
+        mock_pyproject = Mock()
+        mock_pyproject.nodes.get_existing.return_value = {"good": good, "bad": bad}
+
+        events = []
+        callbacks = NodeInstallCallbacks(
+            on_node_start=lambda name, idx, total: events.append(("start", name, idx, total)),
+            on_node_complete=lambda name, ok, err: events.append(("complete", name, ok, err)),
+        )
+
+        def fake_downloads(node_infos):
+            # Completion order differs from input order
+            yield bad, None, "HTTP 404"
+            events.append(("downloaded", "good-node"))
+            yield good, cache_dir, None
+
+        mock_node_lookup = Mock()
+        mock_node_lookup.download_many_to_cache.side_effect = fake_downloads
+
+        node_manager = NodeManager(
+            mock_pyproject, Mock(), mock_node_lookup, Mock(), custom_nodes_dir, Mock()
+        )
+
+        node_manager.sync_nodes_to_filesystem(callbacks=callbacks)
+
+        assert events == [
+            ("start", "bad-node", 1, 2),
+            ("complete", "bad-node", False, "HTTP 404"),
+            ("downloaded", "good-node"),
+            ("start", "good-node", 2, 2),
+            ("complete", "good-node", True, None),
+        ]
+        assert (custom_nodes_dir / "good-node" / "node.py").exists()
+
@@ -335,6 +335,17 @@ class TestPyprojectCaching:
         assert stats['instance_loads'] == 2, "Post-save load should reload from disk"
         assert config_after_save['project']['version'] == "2.0.0", "Should see updated version"
 
+    def test_save_replaces_file_atomically(self, temp_pyproject):
+        """Saving should swap in a complete file and leave no temp file behind."""
+        manager = PyprojectManager(temp_pyproject)
+        config = manager.load()
+        config['project']['version'] = "3.0.0"
+
+        manager.save(config)
+
+        assert 'version = "3.0.0"' in temp_pyproject.read_text()
+        assert not temp_pyproject.with_name(f"{temp_pyproject.name}.tmp").exists()
+
     def test_mtime_change_invalidates_cache(self, temp_pyproject):
         """Changing file mtime should invalidate cache."""
         import time
@@ -73,6 +73,20 @@ class TestPyTorchBackendManager:
 
         assert backend_file.read_text() == "cu128"
 
+    def test_set_backend_skips_write_when_unchanged(self, temp_cec):
+        """Should leave the file untouched when content is identical."""
+        manager = PyTorchBackendManager(temp_cec)
+        manager.set_backend("cu128", {"torch": "2.9.1+cu128"})
+        backend_file = temp_cec / ".pytorch-backend"
+        mtime = backend_file.stat().st_mtime_ns
+        inode = backend_file.stat().st_ino
+
+        manager.set_backend("cu128", {"torch": "2.9.1+cu128"})
+
+        assert backend_file.stat().st_mtime_ns == mtime
+        assert backend_file.stat().st_ino == inode
+        assert not (temp_cec / ".pytorch-backend.tmp").exists()
+
     def test_set_backend_with_versions(self, temp_cec):
         """Should write backend and versions to file."""
         manager = PyTorchBackendManager(temp_cec)
@@ -120,6 +134,23 @@ class TestPyTorchBackendManager:
         manager = PyTorchBackendManager(temp_cec)
         assert manager.get_versions() == {}
 
+    def test_get_versions_rereads_after_external_edit(self, temp_cec):
+        """Should reuse the cached parse but pick up changes to the file."""
+        import os
+
+        backend_file = temp_cec / ".pytorch-backend"
+        backend_file.write_text("cu128\ntorch=2.9.1+cu128")
+        manager = PyTorchBackendManager(temp_cec)
+        assert manager.get_versions() == {"torch": "2.9.1+cu128"}
+
+        manager.get_versions()["torch"] = "mutated"
+        assert manager.get_versions() == {"torch": "2.9.1+cu128"}
+
+        backend_file.write_text("cpu\ntorch=2.9.1+cpu")
+        os.utime(backend_file, ns=(0, 0))
+        assert manager.get_backend() == "cpu"
+        assert manager.get_versions() == {"torch": "2.9.1+cpu"}
+
     def test_get_versions_returns_empty_when_file_missing(self, temp_cec):
         """Should return empty dict when file doesn't exist."""
         manager = PyTorchBackendManager(temp_cec)
@@ -211,6 +242,25 @@ class TestPyTorchBackendManager:
         # Should use the override backend for index URL
         assert any("cpu" in idx.get("url", "") for idx in config["indexes"])
 
+    def test_get_pytorch_config_override_probes_once(self, temp_cec, monkeypatch):
+        """Should reuse probed versions for repeated override configs."""
+        from comfygit_core.utils import pytorch_prober
+
+        probe_calls = []
+
+        def mock_probe(python_version, backend):
+            probe_calls.append((python_version, backend))
+            return {"torch": "2.9.1+cpu"}, backend
+
+        monkeypatch.setattr(pytorch_prober, "probe_pytorch_versions", mock_probe)
+        manager = PyTorchBackendManager(temp_cec)
+
+        first = manager.get_pytorch_config(backend_override="cpu", python_version="3.12")
+        second = manager.get_pytorch_config(backend_override="cpu", python_version="3.12")
+
+        assert first["constraints"] == second["constraints"] == ["torch==2.9.1+cpu"]
+        assert probe_calls == [("3.12", "cpu")]
+
 
 class TestPyTorchBackendValidation:
     """Tests for backend validation."""
@@ -260,7 +310,7 @@ class TestPyTorchBackendValidation:
         """Should reject clearly invalid backends."""
         manager = PyTorchBackendManager(temp_cec)
 
-        for backend in ["invalid", "cuda12", "rocm", "", "123"]:
+        for backend in ["invalid", "cuda12", "rocm", "", "123", "cpu\n"]:
             assert not manager.is_valid_backend(backend)
 
 
@@ -327,6 +377,18 @@ class TestGitignoreUpdate:
         content = gitignore.read_text()
         assert content.count(".pytorch-backend") == 1
 
+    def test_gitignore_checked_once_per_manager(self, temp_cec):
+        """Repeated set_backend calls should not re-read .gitignore."""
+        manager = PyTorchBackendManager(temp_cec)
+        manager.set_backend("cu128")
+        gitignore = temp_cec / ".gitignore"
+        gitignore.unlink()
+
+        manager.set_backend("cpu")
+
+        # Already confirmed by this manager - no second check recreates the file
+        assert not gitignore.exists()
+
 
 class TestEnsureBackend:
     """Tests for ensure_backend() method."""
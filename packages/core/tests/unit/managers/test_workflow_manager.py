@@ -1,8 +1,16 @@
 """Tests for WorkflowManager normalization logic."""
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 from comfygit_core.managers.workflow_manager import WorkflowManager
+from comfygit_core.models.manifest import ManifestWorkflowModel
+from comfygit_core.models.shared import ModelWithLocation
+from comfygit_core.models.workflow import (
+    BatchDownloadCallbacks,
+    ResolutionResult,
+    ResolvedModel,
+    WorkflowNodeWidgetRef,
+)
 from comfygit_core.utils.workflow_hash import normalize_workflow
 
 
@@ -248,6 +256,285 @@ def test_apply_resolution_empty_sources_for_new_models(workflow_manager):
     pass
 
 
+def test_get_workflow_status_concurrent_keeps_order_and_skips_failures(workflow_manager):
+    """Concurrent status analysis keeps workflow order, drops failed workflows and
+    builds shared resolver state before the workers start."""
+    import time
+    from types import SimpleNamespace
+    from comfygit_core.models.workflow import WorkflowSyncStatus
+
+    sync_status = WorkflowSyncStatus(
+        new=["a", "b"], modified=["c"], deleted=[], synced=["d", "e"]
+    )
+    workflow_manager.pyproject.nodes.get_existing.return_value = {}
+    warmed = []
+
+    def fake_analyze(name, sync_state, installed_nodes):
+        warmed.append(all(
+            attr in workflow_manager.__dict__
+            for attr in ("global_node_resolver", "model_resolver", "model_config")
+        ))
+        # Earlier workflows finish last, so completion order != workflow order
+        time.sleep({"a": 0.05, "b": 0.03}.get(name, 0))
+        if name == "c":
+            raise ValueError("broken workflow")
+        return SimpleNamespace(name=name, sync_state=sync_state)
+
+    with patch.object(workflow_manager, 'analyze_single_workflow_status', side_effect=fake_analyze):
+        status = workflow_manager.get_workflow_status(sync_status)
+
+    assert [(a.name, a.sync_state) for a in status.analyzed_workflows] == [
+        ("a", "new"), ("b", "new"), ("d", "synced"), ("e", "synced")
+    ]
+    assert warmed == [True] * 5
+
+
+_TARGET = Path("checkpoints/m.safetensors")
+
+
+def _indexed_model(hash="h"):
+    """An index entry as returned by a finished download or a source-URL lookup."""
+    return ModelWithLocation(hash=hash, filename="m.safetensors", file_size=1,
+                             relative_path="checkpoints/m.safetensors", mtime=0.0, last_seen=0)
+
+
+def _download_batch(workflow_manager, intents):
+    """Stub workflow "wf" whose models are all pending download intents.
+
+    Args:
+        workflow_manager: Manager whose pyproject, index and downloader get stubbed
+        intents: (model_source, target_path) per intent, for m1.safetensors, m2...
+
+    Returns:
+        (refs, models, result) - the widget refs, their manifest models and the
+        ResolutionResult to pass to execute_pending_downloads
+    """
+    refs = [
+        WorkflowNodeWidgetRef(node_id=str(i), node_type="CheckpointLoaderSimple",
+                              widget_index=0, widget_value=f"m{i}.safetensors")
+        for i in range(1, len(intents) + 1)
+    ]
+    models = [
+        ManifestWorkflowModel(filename=ref.widget_value, category="checkpoints",
+                              criticality="flexible", status="unresolved", nodes=[ref])
+        for ref in refs
+    ]
+    workflow_manager.pyproject.load = Mock(return_value={})
+    workflow_manager.pyproject.workflows.get_workflow_models = Mock(return_value=models)
+    workflow_manager.model_repository.find_by_source_urls.return_value = {}
+    workflow_manager.downloader = Mock(models_dir=Path("/models"))
+
+    result = ResolutionResult(workflow_name="wf", models_resolved=[
+        ResolvedModel(workflow="wf", reference=ref, match_type="download_intent",
+                      model_source=source, target_path=target_path)
+        for ref, (source, target_path) in zip(refs, intents, strict=True)
+    ])
+    return refs, models, result
+
+
+def test_execute_pending_downloads_saves_pyproject_once(workflow_manager):
+    """Hash updates for every download intent should be written in a single save."""
+    _, models, result = _download_batch(workflow_manager, [
+        ("https://example.com/m1.safetensors", None),
+        ("https://example.com/m2.safetensors", None),
+    ])
+    config = workflow_manager.pyproject.load.return_value
+    workflow_manager.model_repository.find_by_source_urls.side_effect = (
+        lambda urls: {url: _indexed_model() for url in urls}
+    )
+
+    results = workflow_manager.execute_pending_downloads(result)
+
+    assert [r.reused for r in results] == [True, True]
+    assert all(m.hash == "h" for m in models)
+    workflow_manager.model_repository.get_model.assert_not_called()
+    workflow_manager.pyproject.save.assert_called_once_with(config)
+    workflow_manager.pyproject.workflows.get_workflow_models.assert_called_once()
+    workflow_manager.pyproject.workflows.set_workflow_models.assert_called_once_with(
+        "wf", models, config=config
+    )
+
+
+def test_execute_pending_downloads_concurrent_shares_url_downloads(workflow_manager):
+    """Without progress output, intents sharing a URL should trigger one download."""
+    refs, models, result = _download_batch(workflow_manager, [
+        ("https://example.com/a", _TARGET),
+        ("https://example.com/b", _TARGET),
+        ("https://example.com/a", _TARGET),
+    ])
+    workflow_manager.downloader.download.side_effect = (
+        lambda request, progress_callback=None:
+            Mock(success=True, model=_indexed_model(request.url[-1]), error=None)
+    )
+
+    results = workflow_manager.execute_pending_downloads(result)
+
+    assert workflow_manager.downloader.download.call_count == 2
+    assert [r.filename for r in results] == [ref.widget_value for ref in refs]
+    assert [r.reused for r in results] == [False, False, True]
+    assert [m.hash for m in models] == ["a", "b", "a"]
+    workflow_manager.pyproject.save.assert_called_once()
+
+
+def test_execute_pending_downloads_sequential_reuses_batch_download(workflow_manager):
+    """With progress output (sequential), a repeated URL should reuse the batch's download."""
+    _, _, result = _download_batch(workflow_manager, [
+        ("https://example.com/m", _TARGET),
+        ("https://example.com/m", _TARGET),
+    ])
+    workflow_manager.downloader.download.return_value = Mock(success=True, model=_indexed_model(), error=None)
+
+    results = workflow_manager.execute_pending_downloads(
+        result, BatchDownloadCallbacks(on_file_progress=Mock())
+    )
+
+    workflow_manager.downloader.download.assert_called_once()
+    workflow_manager.model_repository.find_by_source_urls.assert_called_once_with({"https://example.com/m"})
+    assert [r.reused for r in results] == [False, True]
+
+
+def test_execute_pending_downloads_sequential_primes_other_hosts(workflow_manager):
+    """Sequential batches should warm connections to hosts other than the first download's."""
+    _, _, result = _download_batch(workflow_manager, [
+        ("https://a.example/1", _TARGET),
+        ("https://a.example/2", _TARGET),
+        ("https://b.example/3", _TARGET),
+    ])
+    workflow_manager.downloader.download.return_value = Mock(success=False, model=None, error="x")
+
+    workflow_manager.execute_pending_downloads(result, BatchDownloadCallbacks(on_file_progress=Mock()))
+
+    workflow_manager.downloader.prime_connections.assert_called_once_with(["https://b.example/3"])
+
+
+def test_execute_pending_downloads_fails_invalid_intents_up_front(workflow_manager):
+    """Intents without a usable source or target should fail before the batch starts."""
+    _, _, result = _download_batch(workflow_manager, [
+        (None, None),
+        ("https://example.com/known", None),
+        ("https://example.com/unknown", None),
+    ])
+    workflow_manager.model_repository.find_by_source_urls.return_value = {
+        "https://example.com/known": _indexed_model()
+    }
+    callbacks = BatchDownloadCallbacks(
+        on_batch_start=Mock(), on_file_complete=Mock(), on_batch_complete=Mock()
+    )
+
+    results = workflow_manager.execute_pending_downloads(result, callbacks)
+
+    # Invalid intents are still reported, but totals only count the runnable batch
+    error = "Download intent missing target_path or model_source"
+    assert callbacks.on_file_complete.call_args_list == [
+        call("m1.safetensors", False, error),
+        call("m3.safetensors", False, error),
+        call("m2.safetensors", True, None),
+    ]
+    callbacks.on_batch_start.assert_called_once_with(1)
+    callbacks.on_batch_complete.assert_called_once_with(1, 1)
+    assert [(r.filename, r.success) for r in results] == [
+        ("m1.safetensors", False), ("m2.safetensors", True), ("m3.safetensors", False)
+    ]
+    workflow_manager.downloader.download.assert_not_called()
+
+
+def test_execute_pending_downloads_targetless_intent_reuses_later_download(workflow_manager):
+    """A target-less intent should reuse a download from an intent listed after it."""
+    _, _, result = _download_batch(workflow_manager, [
+        ("https://example.com/m", None),
+        ("https://example.com/m", _TARGET),
+    ])
+    workflow_manager.downloader.download.return_value = Mock(success=True, model=_indexed_model(), error=None)
+
+    results = workflow_manager.execute_pending_downloads(
+        result, BatchDownloadCallbacks(on_file_progress=Mock())
+    )
+
+    workflow_manager.downloader.download.assert_called_once()
+    assert [(r.filename, r.success, r.reused) for r in results] == [
+        ("m1.safetensors", True, True), ("m2.safetensors", True, False)
+    ]
+
+
+def test_execute_pending_downloads_unknown_reference_fails_only_that_file(workflow_manager):
+    """A download whose reference is not tracked should not abort the rest of the batch."""
+    _, models, result = _download_batch(workflow_manager, [
+        ("https://example.com/0", _TARGET),
+        ("https://example.com/1", _TARGET),
+    ])
+    tracked = models[1]
+    workflow_manager.pyproject.workflows.get_workflow_models.return_value = [tracked]
+    workflow_manager.downloader.download.return_value = Mock(success=True, model=_indexed_model(), error=None)
+
+    results = workflow_manager.execute_pending_downloads(result, max_workers=1)
+
+    assert [r.success for r in results] == [False, True]
+    assert "not found in workflow" in results[0].error
+    assert tracked.hash == "h"
+    workflow_manager.pyproject.save.assert_called_once()
+
+
+def test_update_model_criticalities_writes_once_and_skips_noops(workflow_manager):
+    """Bulk criticality updates should load and write once, and not write when unchanged."""
+    from comfygit_core.models.manifest import ManifestWorkflowModel
+
+    models = [
+        ManifestWorkflowModel(filename="a.safetensors", category="checkpoints", hash="ha",
+                              criticality="flexible", status="resolved", nodes=[]),
+        ManifestWorkflowModel(filename="b.safetensors", category="loras",
+                              criticality="flexible", status="unresolved", nodes=[]),
+    ]
+    workflows = workflow_manager.pyproject.workflows
+    workflows.get_workflow_models = Mock(return_value=models)
+
+    found = workflow_manager.update_model_criticalities(
+        "wf", {"ha": "required", "b.safetensors": "optional", "missing": "required"}
+    )
+
+    assert found == {"ha": True, "b.safetensors": True, "missing": False}
+    assert [m.criticality for m in models] == ["required", "optional"]
+    workflows.get_workflow_models.assert_called_once()
+    workflows.set_workflow_models.assert_called_once_with("wf", models)
+
+    workflows.set_workflow_models.reset_mock()
+    assert workflow_manager.update_model_criticality("wf", "ha", "required")
+    workflows.set_workflow_models.assert_not_called()
+
+
+def test_update_model_hash_skips_already_resolved_model(workflow_manager):
+    """Re-applying the same hash should not touch the repository or rewrite pyproject."""
+    from comfygit_core.models.manifest import ManifestWorkflowModel
+    from comfygit_core.models.workflow import WorkflowNodeWidgetRef
+
+    ref = WorkflowNodeWidgetRef(node_id="1", node_type="CheckpointLoaderSimple",
+                                widget_index=0, widget_value="m.safetensors")
+    model = ManifestWorkflowModel(filename="m.safetensors", category="checkpoints", hash="h",
+                                  criticality="flexible", status="resolved", nodes=[ref])
+    workflow_manager.pyproject.workflows.get_workflow_models = Mock(return_value=[model])
+
+    workflow_manager._update_model_hash("wf", ref, "h")
+
+    workflow_manager.model_repository.get_model.assert_not_called()
+    workflow_manager.pyproject.models.add_model.assert_not_called()
+    workflow_manager.pyproject.workflows.set_workflow_models.assert_not_called()
+    workflow_manager.pyproject.save.assert_not_called()
+
+
+def test_update_workflow_model_paths_batch_invalidates_written_workflows(workflow_manager):
+    """Batch path updates should write every workflow and invalidate only changed ones."""
+    resolutions = [Mock(workflow_name=name) for name in ("a", "b", "c")]
+    workflow_manager._write_workflow_model_paths = Mock(side_effect=lambda r: r.workflow_name != "b")
+    workflow_manager.workflow_cache = Mock()
+
+    workflow_manager.update_workflow_model_paths_batch(resolutions)
+
+    assert workflow_manager._write_workflow_model_paths.call_count == 3
+    invalidated = {
+        c.kwargs["workflow_name"] for c in workflow_manager.workflow_cache.invalidate.call_args_list
+    }
+    assert invalidated == {"a", "c"}
+
+
 class TestStripBaseDirectoryForNode:
     """Test path stripping logic for ComfyUI node loaders.
 
@@ -575,4 +862,36 @@ class TestOptionalUnresolvedModelPersistence:
         # Type C: Optional unresolved (THE FIX!)
         assert model_c_written.status == "unresolved"
         assert model_c_written.hash is None
-        assert model_c_written.criticality == "optional"
\ No newline at end of file
+        assert model_c_written.criticality == "optional"
+
+def test_resolve_workflow_reads_pyproject_once(workflow_manager):
+    """All pyproject lookups in resolve_workflow should share a single loaded config."""
+    from comfygit_core.models.workflow import WorkflowDependencies
+
+    config = {}
+    pyproject = workflow_manager.pyproject
+    pyproject.load = Mock(return_value=config)
+    pyproject.workflows.get_workflow_models.return_value = []
+    pyproject.models.get_all.return_value = []
+
+    workflow_manager.resolve_workflow(WorkflowDependencies(workflow_name="wf"))
+
+    pyproject.load.assert_called_once()
+    pyproject.nodes.get_existing.assert_called_once_with(config=config)
+    pyproject.workflows.get_custom_node_map.assert_called_once_with("wf", config=config)
+    pyproject.workflows.get_workflow_models.assert_called_once_with("wf", config=config)
+    # Global models table is deferred until a strategy reads it
+    pyproject.models.get_all.assert_not_called()
+
+
+def test_lazy_global_models_loads_on_first_access(workflow_manager):
+    """The global models table should be read once, on first lookup."""
+    model = Mock(hash="h")
+    workflow_manager.pyproject.models.get_all.return_value = [model]
+
+    global_models = workflow_manager._lazy_global_models(config={})
+
+    workflow_manager.pyproject.models.get_all.assert_not_called()
+    assert global_models.get("h") is model
+    assert "missing" not in global_models
+    workflow_manager.pyproject.models.get_all.assert_called_once_with(config={})
@@ -0,0 +1,128 @@
+"""Tests for ModelResolver resolution strategies."""
+
+from unittest.mock import Mock
+
+from comfygit_core.models.shared import ModelWithLocation
+from comfygit_core.models.workflow import ModelResolutionContext, WorkflowNodeWidgetRef
+from comfygit_core.resolvers.model_resolver import ModelResolver
+
+
+def make_model(relative_path: str, hash: str) -> ModelWithLocation:
+    return ModelWithLocation(
+        hash=hash,
+        file_size=1024,
+        relative_path=relative_path,
+        filename=relative_path.rsplit("/", 1)[-1],
+        mtime=0.0,
+        last_seen=0,
+    )
+
+
+def make_ref(widget_value: str, node_type: str = "CustomLoader") -> WorkflowNodeWidgetRef:
+    return WorkflowNodeWidgetRef(
+        node_id="1", node_type=node_type, widget_index=0, widget_value=widget_value
+    )
+
+
+class TestFilenameIndex:
+    """Filename strategy uses the batch index instead of per-ref repository queries."""
+
+    def test_filename_match_uses_batch_index(self):
+        """SHOULD resolve by filename from the index without querying the repository."""
+        repo = Mock()
+        repo.find_by_exact_path.return_value = None
+        repo.get_all_models.return_value = [
+            make_model("checkpoints/sd15.safetensors", "aaa"),
+            make_model("loras/style.safetensors", "bbb"),
+        ]
+        resolver = ModelResolver(model_repository=repo)
+        by_filename, by_path_lower = resolver.build_model_indexes()
+        context = ModelResolutionContext(
+            workflow_name="wf", models_by_filename=by_filename, models_by_path_lower=by_path_lower
+        )
+
+        result = resolver.resolve_model(make_ref("old/dir/SD15.safetensors"), context)
+
+        assert len(result) == 1
+        assert result[0].match_type == "filename"
+        assert result[0].resolved_model.hash == "aaa"
+        repo.find_by_filename.assert_not_called()
+
+    def test_filename_index_reports_ambiguous_matches(self):
+        """SHOULD return every model sharing the filename for disambiguation."""
+        repo = Mock()
+        repo.find_by_exact_path.return_value = None
+        repo.get_all_models.return_value = [
+            make_model("checkpoints/model.safetensors", "aaa"),
+            make_model("loras/model.safetensors", "bbb"),
+        ]
+        resolver = ModelResolver(model_repository=repo)
+        by_filename, by_path_lower = resolver.build_model_indexes()
+        context = ModelResolutionContext(
+            workflow_name="wf", models_by_filename=by_filename, models_by_path_lower=by_path_lower
+        )
+
+        result = resolver.resolve_model(make_ref("model.safetensors"), context)
+
+        assert {r.resolved_model.hash for r in result} == {"aaa", "bbb"}
+        assert all(r.match_confidence == 0.0 for r in result)
+
+    def test_case_insensitive_match_uses_batch_index(self):
+        """SHOULD resolve a differently-cased path without scanning all models per ref."""
+        repo = Mock()
+        repo.find_by_exact_path.return_value = None
+        repo.get_all_models.return_value = [make_model("checkpoints/SD15.safetensors", "aaa")]
+        resolver = ModelResolver(model_repository=repo)
+        by_filename, by_path_lower = resolver.build_model_indexes()
+        context = ModelResolutionContext(
+            workflow_name="wf", models_by_filename=by_filename, models_by_path_lower=by_path_lower
+        )
+
+        result = resolver.resolve_model(make_ref("checkpoints/sd15.safetensors"), context)
+
+        assert len(result) == 1
+        assert result[0].match_type == "case_insensitive"
+        assert repo.get_all_models.call_count == 1
+
+
+class TestExactMatch:
+    """Exact and reconstructed strategies use the repository's path lookup."""
+
+    def test_reconstructed_path_resolves_via_exact_lookup(self):
+        """SHOULD resolve a loader ref through its reconstructed directory path."""
+        model = make_model("checkpoints/sd15.safetensors", "aaa")
+        repo = Mock()
+        repo.find_by_exact_path.side_effect = (
+            lambda path: model if path == "checkpoints/sd15.safetensors" else None
+        )
+        resolver = ModelResolver(model_repository=repo)
+
+        result = resolver.resolve_model(
+            make_ref("sd15.safetensors", node_type="CheckpointLoaderSimple"),
+            ModelResolutionContext(workflow_name="wf"),
+        )
+
+        assert len(result) == 1
+        assert result[0].match_type == "reconstructed"
+        assert result[0].resolved_model is model
+        repo.get_all_models.assert_not_called()
+
+    def test_exact_match_served_from_batch_index(self):
+        """SHOULD answer exact lookups from the batch index without per-path queries."""
+        model = make_model("checkpoints/sd15.safetensors", "aaa")
+        repo = Mock()
+        repo.get_all_models.return_value = [model, make_model("checkpoints/SD15.safetensors", "bbb")]
+        resolver = ModelResolver(model_repository=repo)
+        by_filename, by_path_lower = resolver.build_model_indexes()
+        context = ModelResolutionContext(
+            workflow_name="wf", models_by_filename=by_filename, models_by_path_lower=by_path_lower
+        )
+
+        result = resolver.resolve_model(
+            make_ref("sd15.safetensors", node_type="CheckpointLoaderSimple"), context
+        )
+
+        assert len(result) == 1
+        assert result[0].match_type == "reconstructed"
+        assert result[0].resolved_model is model
+        repo.find_by_exact_path.assert_not_called()
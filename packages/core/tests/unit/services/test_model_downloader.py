@@ -161,7 +161,7 @@ class TestModelDownloader:
         assert result.success is True
         assert result.model == existing_model
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_download_new_model_success(self, mock_get, tmp_path):
         """Test downloading a new model successfully."""
         # Setup mock HTTP response
@@ -207,7 +207,7 @@ class TestModelDownloader:
         assert result.model is not None
         assert result.error is None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_download_handles_http_errors(self, mock_get, tmp_path):
         """Test download handles HTTP errors gracefully."""
         # Setup mock to raise exception
@@ -230,7 +230,7 @@ class TestModelDownloader:
         assert "Connection timeout" in result.error
         assert result.model is None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_download_computes_hash_during_download(self, mock_get, tmp_path):
         """Test that hash is computed during download (streaming)."""
         # Setup mock with known content
@@ -291,7 +291,7 @@ class TestModelDownloader:
         # Should use the hint path
         assert "file.safetensors" in str(path)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_download_calls_progress_callback(self, mock_get, tmp_path):
         """Test that download calls progress callback with current and total bytes."""
         # Setup mock with known content
@@ -379,7 +379,7 @@ class TestModelDownloader:
         with pytest.raises(ValueError, match="No models directory available"):
             ModelDownloader(repo, workspace_config)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_civitai_url_gets_auth_header_with_api_key(self, mock_get, tmp_path):
         """Test that Civitai URLs get Authorization header when API key is configured."""
         # Setup mock response
@@ -413,7 +413,7 @@ class TestModelDownloader:
         assert call_kwargs['headers'] == {'Authorization': 'Bearer test_api_key_12345'}
         assert result.success is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_civitai_url_no_auth_header_without_api_key(self, mock_get, tmp_path):
         """Test that Civitai URLs work without auth header when API key returns None."""
         # Setup mock response
@@ -447,7 +447,7 @@ class TestModelDownloader:
         assert call_kwargs['headers'] == {}
         assert result.success is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_civitai_url_no_auth_header_when_api_key_is_none(self, mock_get, tmp_path):
         """Test that Civitai URLs work when workspace_config returns None for API key."""
         # Setup mock response
@@ -482,7 +482,7 @@ class TestModelDownloader:
         assert call_kwargs['headers'] == {}
         assert result.success is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_non_civitai_url_no_auth_header_even_with_api_key(self, mock_get, tmp_path):
         """Test that non-Civitai URLs don't get auth header even when API key is configured."""
         # Setup mock response
@@ -516,7 +516,7 @@ class TestModelDownloader:
         assert call_kwargs['headers'] == {}  # Empty, no auth header
         assert result.success is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_civitai_url_case_insensitive(self, mock_get, tmp_path):
         """Test that Civitai URL detection is case-insensitive."""
         # Setup mock response
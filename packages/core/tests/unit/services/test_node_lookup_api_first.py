@@ -185,6 +185,119 @@ class TestNodeLookupAPIFirst:
         # ASSERT
         assert result is None
 
+    def test_find_node_skips_install_call_when_latest_has_download_url(self, cache_dir):
+        """SHOULD reuse latest_version from get_node instead of a second install request."""
+        # ARRANGE
+        mock_registry_client = MagicMock()
+        mock_registry_client.get_node.return_value = RegistryNodeInfo(
+            id="test-package-id",
+            name="Test Package",
+            description="Test description",
+            repository="https://github.com/test/repo",
+            latest_version=RegistryNodeVersion(
+                changelog="",
+                dependencies=[],
+                deprecated=False,
+                id="test-package-id-v2.0.0",
+                version="2.0.0",
+                download_url="https://cdn.comfy.org/test-package-id/2.0.0/node.zip"
+            )
+        )
+
+        service = NodeLookupService(cache_path=cache_dir)
+        service.registry_client = mock_registry_client
+
+        # ACT
+        result = service.find_node("test-package-id")
+        service.find_node("test-package-id@1.0.0")
+
+        # ASSERT
+        assert result.download_url == "https://cdn.comfy.org/test-package-id/2.0.0/node.zip"
+        mock_registry_client.install_node.assert_called_once_with("test-package-id", "1.0.0")
+
+    def test_find_node_memoizes_repeated_lookups(self, cache_dir):
+        """SHOULD hit the API once per identifier and hand out independent copies."""
+        # ARRANGE
+        mock_registry_client = MagicMock()
+        mock_registry_client.get_node.return_value = RegistryNodeInfo(
+            id="test-package-id",
+            name="Test Package",
+            description="Test description",
+            repository="https://github.com/test/repo",
+            latest_version=None,
+        )
+        mock_registry_client.install_node.return_value = RegistryNodeVersion(
+            changelog="",
+            dependencies=[],
+            deprecated=False,
+            id="test-package-id-v1.0.0",
+            version="1.0.0",
+            download_url="https://cdn.comfy.org/test-package-id/1.0.0/node.zip"
+        )
+
+        service = NodeLookupService(cache_path=cache_dir)
+        service.registry_client = mock_registry_client
+
+        # ACT
+        first = service.find_node("test-package-id")
+        first.source = "git"
+        second = service.get_node("test-package-id")
+
+        # ASSERT
+        mock_registry_client.get_node.assert_called_once_with("test-package-id")
+        assert second.source == "registry"
+
+        service.clear_cache()
+        service.find_node("test-package-id")
+        assert mock_registry_client.get_node.call_count == 2
+
+    def test_find_node_does_not_memoize_misses(self, cache_dir):
+        """SHOULD retry the API after a failed lookup instead of caching the miss."""
+        # ARRANGE
+        mock_registry_client = MagicMock()
+        from comfygit_core.models.exceptions import CDRegistryError
+        mock_registry_client.get_node.side_effect = CDRegistryError("Network error")
+
+        service = NodeLookupService(cache_path=cache_dir)
+        service.registry_client = mock_registry_client
+
+        # ACT
+        assert service.find_node("test-package-id") is None
+        service.find_node("test-package-id")
+
+        # ASSERT
+        assert mock_registry_client.get_node.call_count == 2
+
+    def test_find_node_cache_is_bounded(self, cache_dir):
+        """SHOULD evict the oldest memoized lookups beyond FIND_CACHE_MAX_ENTRIES."""
+        # ARRANGE
+        mock_registry_client = MagicMock()
+        mock_registry_client.get_node.side_effect = lambda node_id: RegistryNodeInfo(
+            id=node_id,
+            name=node_id,
+            description="",
+            repository="https://github.com/test/repo",
+            latest_version=RegistryNodeVersion(
+                changelog="",
+                dependencies=[],
+                deprecated=False,
+                id=f"{node_id}-v1.0.0",
+                version="1.0.0",
+                download_url=f"https://cdn.comfy.org/{node_id}/1.0.0/node.zip"
+            )
+        )
+
+        service = NodeLookupService(cache_path=cache_dir)
+        service.registry_client = mock_registry_client
+        service.FIND_CACHE_MAX_ENTRIES = 2
+
+        # ACT
+        for node_id in ("a", "b", "c"):
+            service.find_node(node_id)
+
+        # ASSERT
+        assert list(service._find_cache) == ["b", "c"]
+
 
 class TestWorkspaceConfigNoPreferRegistryCache:
     """Test that prefer_registry_cache has been removed from WorkspaceConfig."""
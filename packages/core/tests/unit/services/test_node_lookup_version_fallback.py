@@ -103,3 +103,43 @@ class TestDownloadToCacheGitFallback:
             call_kwargs = mock_git_clone.call_args
             # Should use commit hash as ref
             assert call_kwargs.kwargs.get('ref') == "abc123def456789012345678901234567890abcd"
+
+
+class TestDownloadManyToCache:
+    """Test concurrent batch downloads."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary cache directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def test_yields_each_node_once_and_isolates_failures(self, cache_dir):
+        """SHOULD yield one result per node, with the error text for failures."""
+        # ARRANGE
+        nodes = [NodeInfo(name=f"node-{i}", source="git") for i in range(5)]
+
+        def fake_download(node_info):
+            if node_info.name == "node-2":
+                raise RuntimeError("boom")
+            if node_info.name == "node-4":
+                return None
+            return cache_dir / node_info.name
+
+        service = NodeLookupService(cache_path=cache_dir)
+
+        with patch.object(service, 'download_to_cache', side_effect=fake_download):
+            # ACT
+            results = {
+                node_info.name: (cache_path, error)
+                for node_info, cache_path, error in service.download_many_to_cache(nodes, max_workers=3)
+            }
+
+        # ASSERT
+        assert results == {
+            "node-0": (cache_dir / "node-0", None),
+            "node-1": (cache_dir / "node-1", None),
+            "node-2": (None, "boom"),
+            "node-3": (cache_dir / "node-3", None),
+            "node-4": (None, "Download failed"),
+        }
@@ -0,0 +1,33 @@
+"""Unit tests for ModelConfig loading."""
+import json
+import os
+
+from comfygit_core.configs.model_config import ModelConfig
+
+
+class TestModelConfigLoadCache:
+    """ModelConfig.load shares parsed configs across callers."""
+
+    def test_default_config_is_shared(self):
+        """Repeated default loads should return the same instance."""
+        assert ModelConfig.load() is ModelConfig.load()
+
+    def test_file_config_reloads_after_change(self, tmp_path):
+        """A changed config file should be re-parsed; an unchanged one reused."""
+        config_path = tmp_path / "models.json"
+        config_path.write_text(json.dumps({"version": "1"}))
+
+        first = ModelConfig.load(config_path)
+        assert ModelConfig.load(config_path) is first
+
+        config_path.write_text(json.dumps({"version": "22"}))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ModelConfig.load(config_path).version == "22"
+
+    def test_clear_cache_forces_reload(self):
+        """clear_cache should drop the shared default instance."""
+        first = ModelConfig.load()
+        ModelConfig.clear_cache()
+        assert ModelConfig.load() is not first
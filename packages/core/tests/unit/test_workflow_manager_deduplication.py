@@ -330,6 +330,7 @@ class TestResolveWorkflowDeduplication:
 
         # All models unresolved (return None)
         manager.model_resolver.resolve_model.return_value = None
+        manager.model_resolver.build_model_indexes.return_value = ({}, {})
 
         # Bind actual resolve_workflow method
         manager.resolve_workflow = WorkflowManager.resolve_workflow.__get__(manager)
@@ -0,0 +1,71 @@
+"""Tests for CUDA version detection in the system detector."""
+
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from comfygit_core.utils import system_detector
+from comfygit_core.utils.system_detector import _query_cuda_version
+
+
+@pytest.fixture(autouse=True)
+def clear_cuda_cache():
+    """The CUDA query is memoized per process; reset it around each test."""
+    _query_cuda_version.cache_clear()
+    yield
+    _query_cuda_version.cache_clear()
+
+
+def _fake_pynvml(version: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        nvmlInit=lambda: None,
+        nvmlShutdown=lambda: None,
+        nvmlSystemGetCudaDriverVersion_v2=lambda: version,
+    )
+
+
+def _nvidia_smi_result(stdout: bytes) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=['nvidia-smi'], returncode=0, stdout=stdout, stderr=b'')
+
+
+class TestQueryCudaVersion:
+    """Tests for _query_cuda_version."""
+
+    def test_uses_nvml_driver_version(self):
+        """Should decode NVML's integer version without spawning nvidia-smi."""
+        with patch.dict(sys.modules, {'pynvml': _fake_pynvml(12080)}), \
+                patch.object(system_detector, 'run_command') as mock_run:
+            assert _query_cuda_version() == "12.8"
+
+        mock_run.assert_not_called()
+
+    def test_returns_none_without_nvidia_smi(self):
+        """Should skip the subprocess entirely when nvidia-smi isn't on PATH."""
+        with patch.dict(sys.modules, {'pynvml': None}), \
+                patch.object(system_detector.shutil, 'which', return_value=None), \
+                patch.object(system_detector, 'run_command') as mock_run:
+            assert _query_cuda_version() is None
+
+        mock_run.assert_not_called()
+
+    def test_parses_nvidia_smi_header(self):
+        """Should read the CUDA version from nvidia-smi's header banner."""
+        stdout = (
+            b"+-----------------------------------------------------------------------------+\n"
+            b"| NVIDIA-SMI 550.54.14    Driver Version: 550.54.14    CUDA Version: 12.4     |\n"
+        )
+        with patch.dict(sys.modules, {'pynvml': None}), \
+                patch.object(system_detector.shutil, 'which', return_value='/usr/bin/nvidia-smi'), \
+                patch.object(system_detector, 'run_command', return_value=_nvidia_smi_result(stdout)):
+            assert _query_cuda_version() == "12.4"
+
+    def test_falls_back_to_full_output_past_banner(self):
+        """Should still find the version when it sits beyond the header window."""
+        stdout = b"x" * 1024 + b"\nCUDA Version: 11.8\n"
+        with patch.dict(sys.modules, {'pynvml': None}), \
+                patch.object(system_detector.shutil, 'which', return_value='/usr/bin/nvidia-smi'), \
+                patch.object(system_detector, 'run_command', return_value=_nvidia_smi_result(stdout)):
+            assert _query_cuda_version() == "11.8"